@@ -1,4 +1,5 @@
 # bundled_tesseract.py
+import functools
 import os, sys
 
 def _app_dir():
@@ -6,12 +7,37 @@ def _app_dir():
         return os.path.dirname(sys.executable)
     return os.path.dirname(os.path.abspath(__file__))
 
+# Candidate exe paths are invariant for the process; build them once at
+# import. First entry is the installed path (Inno Setup target), second the
+# dev checkout path. Each pairs the top-level subdir name (for the scandir
+# filter) with the fully joined exe path.
+_CANDIDATES = tuple(
+    (parts[0], os.path.join(_app_dir(), *parts, "tesseract.exe"))
+    for parts in (("Tesseract-OCR",), ("third_party", "Tesseract-OCR"))
+)
+
 def _candidates():
-    base = _app_dir()
-    # Installed path (Inno Setup target)
-    yield os.path.join(base, "Tesseract-OCR", "tesseract.exe")
-    # Dev path you mentioned
-    yield os.path.join(base, "third_party", "Tesseract-OCR", "tesseract.exe")
+    # One scandir of the app dir replaces a stat per candidate path; only
+    # subdirs that actually exist get probed for tesseract.exe.
+    try:
+        with os.scandir(_app_dir()) as it:
+            names = {e.name for e in it if e.is_dir()}
+    except OSError:
+        names = set()
+    for top, exe in _CANDIDATES:
+        if top in names:
+            yield exe
+
+@functools.lru_cache(maxsize=1)
+def _resolve() -> tuple[str | None, str | None]:
+    """Probe candidate paths once; the install location never moves at runtime."""
+    for p in _candidates():
+        if os.path.isfile(p):
+            # prefer ...\Tesseract-OCR\tessdata
+            cand = os.path.join(os.path.dirname(p), "tessdata")
+            td = cand if os.path.isdir(cand) else None
+            return p, td
+    return None, None
 
 def use_bundled_tesseract(cfg: dict | None = None) -> tuple[str | None, str | None]:
     """
@@ -20,21 +46,23 @@ def use_bundled_tesseract(cfg: dict | None = None) -> tuple[str | None, str | No
     - Sets env so child processes inherit
     - Writes cfg["tesseract_cmd"] (exe) and cfg["tessdata_dir"] (dir with *.traineddata)
     Returns (exe_path or None, tessdata_dir or None)
+
+    Path probing is cached, so repeat calls skip the filesystem entirely.
     """
-    exe = None
-    td = None
-    for p in _candidates():
-        if os.path.exists(p):
-            exe = p
-            # prefer ...\Tesseract-OCR\tessdata
-            cand = os.path.join(os.path.dirname(p), "tessdata")
-            td = cand if os.path.isdir(cand) else None
-            break
+    exe, td = _resolve()
 
     if exe:
         # Make it work for current process
         try:
             import pytesseract
+            if pytesseract.pytesseract.tesseract_cmd == exe:
+                # Already configured by an earlier call: env/PATH are set,
+                # just refresh cfg and skip the side effects.
+                if cfg is not None:
+                    cfg["tesseract_cmd"] = exe
+                    if td:
+                        cfg["tessdata_dir"] = td
+                return exe, td
             pytesseract.pytesseract.tesseract_cmd = exe
         except Exception:
             pass
@@ -52,3 +80,8 @@ def use_bundled_tesseract(cfg: dict | None = None) -> tuple[str | None, str | No
             if td:
                 cfg["tessdata_dir"] = td
     return exe, td
+
+def use_bundled_tesseract_legacy(cfg: dict | None = None) -> str | None:
+    """Back-compat shim for callers that expect just the exe path."""
+    exe, _ = use_bundled_tesseract(cfg)
+    return exe
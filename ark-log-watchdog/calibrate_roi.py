@@ -9,51 +9,99 @@ def select_roi_on_image(img):
     selecting = False
     rect = None
 
+    dirty = True  # repaint needed (initial frame, then only on ROI changes)
+
     def on_mouse(event, x, y, flags, param):
-        nonlocal roi, selecting, rect, clone
+        nonlocal roi, selecting, rect, clone, dirty
         if event == cv2.EVENT_LBUTTONDOWN:
             roi[0] = (x,y)
             roi[1] = (x,y)
             selecting = True
+            dirty = True
         elif event == cv2.EVENT_MOUSEMOVE and selecting:
             roi[1] = (x,y)
+            dirty = True
         elif event == cv2.EVENT_LBUTTONUP:
             roi[1] = (x,y)
             selecting = False
+            dirty = True
 
     cv2.namedWindow("Select ROI (drag). Press S=save, R=reset, Q=quit")
     cv2.setMouseCallback("Select ROI (drag). Press S=save, R=reset, Q=quit", on_mouse)
 
+    # Persistent display buffer: restore only the previously drawn rectangle
+    # region from the clean clone instead of copying the whole frame per tick.
+    frame = clone.copy()
+    prev_rect = None
     while True:
-        frame = clone.copy()
+        key = -1
+        if not dirty:
+            # Idle: block in waitKey instead of repainting at 50 FPS
+            key = cv2.waitKey(100) & 0xFF
+            if key == 255 and not dirty:
+                continue
+        dirty = False
+        if prev_rect:
+            px0, py0, px1, py1 = prev_rect
+            frame[py0:py1, px0:px1] = clone[py0:py1, px0:px1]
+            prev_rect = None
         if roi[0] and roi[1]:
             x0,y0 = roi[0]
             x1,y1 = roi[1]
-            x0,x1 = sorted([x0,x1])
-            y0,y1 = sorted([y0,y1])
+            if x0 > x1: x0, x1 = x1, x0
+            if y0 > y1: y0, y1 = y1, y0
             cv2.rectangle(frame, (x0,y0), (x1,y1), (0,255,0), 2)
+            # Dirty box (inclusive of the 2px outline) to restore next tick
+            h, w = frame.shape[:2]
+            prev_rect = (max(0, x0-2), max(0, y0-2), min(w, x1+3), min(h, y1+3))
         cv2.imshow("Select ROI (drag). Press S=save, R=reset, Q=quit", frame)
-        key = cv2.waitKey(20) & 0xFF
+        if key in (-1, 255):
+            key = cv2.waitKey(20) & 0xFF
         if key in (ord('q'), 27):
             cv2.destroyAllWindows()
             return None
         if key == ord('r'):
             roi = [None,None]
+            dirty = True
         if key == ord('s'):
             if roi[0] and roi[1]:
                 x0,y0 = roi[0]
                 x1,y1 = roi[1]
-                x0,x1 = sorted([x0,x1])
-                y0,y1 = sorted([y0,y1])
+                if x0 > x1: x0, x1 = x1, x0
+                if y0 > y1: y0, y1 = y1, y0
                 cv2.destroyAllWindows()
                 return (x0,y0,x1-x0,y1-y0)
 
-def main():
+def grab_screen():
     with mss() as sct:
         monitor = sct.monitors[0]  # virtual screen
+        # DXcam (DXGI Desktop Duplication) is ~3x faster than MSS on Windows
+        # and hands back a 3-channel frame directly, skipping the BGRA->BGR
+        # copy — but it captures the primary output only, so take it just
+        # when the virtual screen coincides with the primary; otherwise the
+        # calibrated ROI would not line up with the watcher's
+        # virtual-screen-relative grabs.
+        if int(monitor["left"]) == 0 and int(monitor["top"]) == 0:
+            try:
+                import dxcam
+                cam = dxcam.create(output_color="BGR")
+                if cam is not None and (int(cam.width), int(cam.height)) == \
+                        (int(monitor["width"]), int(monitor["height"])):
+                    img = cam.grab()
+                    if img is not None:
+                        return img
+            except Exception:
+                pass
+        # Fallback: MSS works everywhere
         shot = sct.grab(monitor)
-        img = np.array(shot)[:,:,:3]  # BGRA -> BGR
+        # View the raw BGRA buffer without copying, then convert into one
+        # contiguous BGR array (np.array(shot)[:,:,:3] would allocate the
+        # full BGRA frame first and leave a non-contiguous view).
+        raw = np.frombuffer(shot.bgra, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+        return cv2.cvtColor(raw, cv2.COLOR_BGRA2BGR)
 
+def main():
+    img = grab_screen()
     roi = select_roi_on_image(img)
     if roi is None:
         print("[INFO] ROI selection cancelled.")
@@ -1,45 +1,200 @@
 # discord_notifier.py
+import io
 import os
 import json
-from typing import Optional, Dict, Any
+import queue
+import threading
+import time
+from typing import Optional, Dict, Any, Tuple, Union
 
 import requests
 
+# Env fallback never changes at runtime; read it once.
+_ENV_URL = os.environ.get("DISCORD_WEBHOOK_URL")
+
+# Shared session: keep-alive + pooled connections so each alert after the
+# first skips the TCP/TLS handshake to discord.com.
+_SESSION: Optional[requests.Session] = None
+
+
+def _session() -> requests.Session:
+    global _SESSION
+    if _SESSION is None:
+        s = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        s.mount("https://", adapter)
+        s.mount("http://", adapter)
+        _SESSION = s
+    return _SESSION
+
+
+# Background sender: a blocking POST (timeout=15) must not stall the capture
+# loop, so posts are queued onto one daemon worker. On overflow the oldest
+# pending alert is dropped and counted.
+_Q: "queue.Queue[Tuple]" = queue.Queue(maxsize=256)
+_WORKER: Optional[threading.Thread] = None
+_DROPPED = 0
+
+
+ImageData = Union[bytes, memoryview, io.BytesIO]
+
+# The allowed_mentions dict comes from config and never changes at runtime,
+# so its JSON fragment is encoded once and spliced into each payload.
+_ALLOWED_JSON_CACHE: Dict[tuple, str] = {}
+
+
+def _freeze(obj: Any) -> Any:
+    if isinstance(obj, dict):
+        return tuple((k, _freeze(v)) for k, v in sorted(obj.items()))
+    if isinstance(obj, list):
+        return tuple(_freeze(v) for v in obj)
+    return obj
+
+
+def _payload_json(content: str, allowed_mentions: Optional[Dict[str, Any]]) -> str:
+    if not allowed_mentions:
+        return json.dumps({"content": content})
+    key = _freeze(allowed_mentions)
+    frag = _ALLOWED_JSON_CACHE.get(key)
+    if frag is None:
+        frag = _ALLOWED_JSON_CACHE[key] = json.dumps(allowed_mentions)
+    return '{"content":%s,"allowed_mentions":%s}' % (json.dumps(content), frag)
+
+
+def _post(url: str, payload_json: str, image_bytes: Optional[ImageData], filename: str,
+          mime: str = "image/png") -> None:
+    if image_bytes:
+        # Callers may hand us a reusable BytesIO/memoryview from the capture
+        # pipeline; pass the file object straight through so requests streams
+        # it instead of wrapping raw bytes in a fresh BytesIO internally.
+        if isinstance(image_bytes, io.BytesIO):
+            image_bytes.seek(0)
+        # multipart/form-data: one file part + one JSON payload part
+        files = {"file": (filename, image_bytes, mime)}
+        data = {"payload_json": payload_json}
+        resp = _session().post(url, data=data, files=files, timeout=15)
+    else:
+        # simple application/json
+        resp = _session().post(url, data=payload_json.encode("utf-8"),
+                               headers={"Content-Type": "application/json"}, timeout=15)
+    resp.raise_for_status()
+
+
+# Alert storms are coalesced: after the first item arrives the worker keeps
+# draining for this window and merges same-destination messages into one POST,
+# staying clear of Discord's 5/s webhook rate limit.
+_COALESCE_WINDOW_S = 0.5
+
+# Discord rejects webhook content over 2000 characters with a 400, so merged
+# batches flush as several POSTs under the cap instead of one oversized one.
+_CONTENT_LIMIT = 2000
+
+
+def _chunk_contents(contents: list) -> list:
+    chunks: list = []
+    cur: list = []
+    cur_len = 0
+    for c in contents:
+        if len(c) > _CONTENT_LIMIT:  # a single oversized message still has to fit
+            c = c[:_CONTENT_LIMIT]
+        add = len(c) + (1 if cur else 0)  # +1 for the joining newline
+        if cur and cur_len + add > _CONTENT_LIMIT:
+            chunks.append("\n".join(cur))
+            cur, cur_len = [], 0
+            add = len(c)
+        cur.append(c)
+        cur_len += add
+    if cur:
+        chunks.append("\n".join(cur))
+    return chunks
+
+
+def _worker_loop() -> None:
+    while True:
+        batch = [_Q.get()]
+        deadline = time.monotonic() + _COALESCE_WINDOW_S
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_Q.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        # Merge messages that share a destination + mention config; keep the
+        # most recent image of each group.
+        groups: Dict[tuple, list] = {}
+        for url, content, allowed, image_bytes, filename, mime in batch:
+            key = (url, _freeze(allowed) if allowed else None, filename, mime)
+            g = groups.setdefault(key, [[], allowed, None])
+            g[0].append(content)
+            if image_bytes is not None:
+                g[2] = image_bytes
+
+        for (url, _, filename, mime), (contents, allowed, image_bytes) in groups.items():
+            chunks = _chunk_contents(contents)
+            for i, chunk in enumerate(chunks):
+                # the kept image is the group's most recent; attach it to
+                # the chunk holding the most recent contents
+                img = image_bytes if i == len(chunks) - 1 else None
+                try:
+                    _post(url, _payload_json(chunk, allowed), img, filename, mime)
+                except Exception as e:
+                    print(f"[WARN] discord post failed: {e}", flush=True)
+
+        for _ in batch:
+            _Q.task_done()
+
+
+def _enqueue(item: Tuple) -> None:
+    global _WORKER, _DROPPED
+    if _WORKER is None or not _WORKER.is_alive():
+        _WORKER = threading.Thread(target=_worker_loop, daemon=True)
+        _WORKER.start()
+    while True:
+        try:
+            _Q.put_nowait(item)
+            return
+        except queue.Full:
+            try:
+                _Q.get_nowait()
+                _DROPPED += 1
+            except queue.Empty:
+                pass
+
 
 def send_to_discord(
     content: str,
-    image_bytes: Optional[bytes] = None,
+    image_bytes: Optional[ImageData] = None,
     filename: str = "image.png",
     allowed_mentions: Optional[Dict[str, Any]] = None,
     webhook_url: Optional[str] = None,
+    wait: bool = False,
+    mime: str = "image/png",
 ) -> None:
     """
     Post to a Discord webhook.
 
     - content: message text (may include @here/@everyone/<@&ROLEID>/<@USERID>)
-    - image_bytes: optional PNG bytes to attach
+    - image_bytes: optional PNG bytes to attach (bytes, memoryview or a
+      reusable io.BytesIO — none of these are copied before upload)
     - filename: name for the uploaded image file
     - allowed_mentions: Discord 'allowed_mentions' payload; e.g.
         {"parse":["everyone","roles"],"roles":["123"],"users":["456"]}
     - webhook_url: override URL (else uses DISCORD_WEBHOOK_URL env)
+    - wait: post synchronously on the caller thread (default enqueues onto
+      the background sender and returns immediately)
+    - mime: content type of the attachment; pass "image/jpeg" with
+      JPEG-encoded bytes for a ~5x cheaper encode than default-level PNG
 
-    Raises requests.HTTPError on non-2xx.
+    Raises requests.HTTPError on non-2xx when wait=True.
     """
-    url = webhook_url or os.getenv("DISCORD_WEBHOOK_URL")
+    url = webhook_url or _ENV_URL
     if not url:
         raise RuntimeError("Discord webhook URL not set (config or DISCORD_WEBHOOK_URL).")
 
-    payload: Dict[str, Any] = {"content": content}
-    if allowed_mentions:
-        payload["allowed_mentions"] = allowed_mentions
-
-    if image_bytes:
-        # multipart/form-data: one file part + one JSON payload part
-        files = {"file": (filename, image_bytes, "image/png")}
-        data = {"payload_json": json.dumps(payload)}
-        resp = requests.post(url, data=data, files=files, timeout=15)
+    if wait:
+        _post(url, _payload_json(content, allowed_mentions), image_bytes, filename, mime)
     else:
-        # simple application/json
-        resp = requests.post(url, json=payload, timeout=15)
-
-    resp.raise_for_status()
+        _enqueue((url, content, allowed_mentions, image_bytes, filename, mime))
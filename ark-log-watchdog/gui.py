@@ -1,54 +1,74 @@
 # gui.py  —  Single-EXE runtime: GUI spawns itself with --watcher
+import copy
+import hashlib
 import os
 import sys
+from collections import OrderedDict
+import time
 import yaml
 import json
+import queue
 import threading
 import subprocess
 import tkinter as tk
 from tkinter import filedialog, messagebox
 from typing import Dict, Any, Optional, List
 
-import numpy as np
-from mss import mss
-from PIL import Image, ImageTk
+# ────────────────────────────────────────────────────────────────────────────────
+# Watcher child mode: dispatch before the GUI stack is imported. numpy/PIL/
+# customtkinter dominate cold start (especially in the one-file EXE) and the
+# watcher needs none of them.
+# ────────────────────────────────────────────────────────────────────────────────
+if __name__ == "__main__" and "--watcher" in sys.argv:
+    try:
+        import watcher as _watcher_module
+        _watcher_module.main()
+    except SystemExit:
+        raise
+    except Exception as e:
+        import traceback
+        print(f"[WATCHER] failed to run: {e}", flush=True)
+        traceback.print_exc()
+        # non-zero so the GUI can log an error instead of “code None”
+        sys.exit(2)
+    sys.exit(0)
+
 import customtkinter as ctk
 from bundled_tesseract import use_bundled_tesseract
+from trigger_utils import compile_trigger
 
 import license_client
 
-# Force PyInstaller to bundle these modules even if we only import them dynamically.
-try:
-    import watcher as _watcher_module  # bundled watcher
-    _HAS_WATCHER_MODULE = True
-except Exception:
-    _watcher_module = None
-    _HAS_WATCHER_MODULE = False
-
-# These are usually imported by watcher, but add hints for the freezer:
-try:
-    import ocr  # noqa: F401
-except Exception:
-    pass
-try:
-    import discord_notifier  # noqa: F401
-except Exception:
-    pass
+# numpy/mss/PIL are imported lazily at their use sites (_grab_screen,
+# RoiSelector) so GUI startup doesn't pay for them up front.
 
-# ────────────────────────────────────────────────────────────────────────────────
-# Try to import watcher so PyInstaller bundles it. (We still launch a child proc)
-# ────────────────────────────────────────────────────────────────────────────────
-try:
-    import watcher as _watcher_module
-    _HAS_WATCHER_MODULE = True
-except Exception:
-    _HAS_WATCHER_MODULE = False
+# Force PyInstaller to bundle the watcher stack even though we only import it
+# dynamically; dev runs skip this so they don't pay the import cost.
+if getattr(sys, "frozen", False):
+    try:
+        import watcher  # noqa: F401
+    except Exception:
+        pass
+    try:
+        import ocr  # noqa: F401
+    except Exception:
+        pass
+    try:
+        import discord_notifier  # noqa: F401
+    except Exception:
+        pass
 
 # ────────────────────────────────────────────────────────────────────────────────
 # Config I/O
 # ────────────────────────────────────────────────────────────────────────────────
 CONFIG_PATH = os.path.join(os.getcwd(), "config.yaml")
 
+# libyaml parses/dumps ~5-10x faster than the pure-Python default
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
 DEFAULT_CFG = {
     "roi": {"x": 1014, "y": 477, "w": 530, "h": 833},
     "discord_webhook_url": "",
@@ -88,38 +108,71 @@ DEFAULT_CFG = {
     "send_only_newest": True,
 }
 
+# Parsed-config cache keyed on (mtime_ns, size): the GUI reloads the config on
+# every save/collect cycle, and the file rarely changes under us.
+_CFG_CACHE: Optional[tuple] = None
+
+def _merge(dst: Dict[str, Any], src: Dict[str, Any]) -> None:
+    # Recursive merge: dicts merge key-wise, anything else overwrites the
+    # default leaf. Any key added to DEFAULT_CFG later is picked up as a
+    # fallback automatically — no per-key special case needed.
+    for k, v in src.items():
+        if isinstance(v, dict) and isinstance(dst.get(k), dict):
+            _merge(dst[k], v)
+        else:
+            dst[k] = v
+
+def _merge_defaults(data: Dict[str, Any]) -> Dict[str, Any]:
+    cfg = copy.deepcopy(DEFAULT_CFG)
+    _merge(cfg, data)
+    if not cfg.get("roi"):
+        cfg["roi"] = copy.deepcopy(DEFAULT_CFG["roi"])
+    return cfg
+
 def load_config() -> Dict[str, Any]:
+    global _CFG_CACHE
     if not os.path.exists(CONFIG_PATH):
         return DEFAULT_CFG.copy()
     try:
-        with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
-        cfg = DEFAULT_CFG.copy()
-        for k, v in data.items():
-            cfg[k] = v
-        if "roi" not in cfg or not cfg["roi"]:
-            cfg["roi"] = DEFAULT_CFG["roi"].copy()
-        if "discord_allowed_mentions" not in cfg:
-            cfg["discord_allowed_mentions"] = DEFAULT_CFG["discord_allowed_mentions"].copy()
-        if "triggers" not in cfg:
-            cfg["triggers"] = DEFAULT_CFG["triggers"].copy()
+        st = os.stat(CONFIG_PATH)
+        key = (st.st_mtime_ns, st.st_size)
+        if _CFG_CACHE is not None and _CFG_CACHE[0] == key:
+            # deep copy so callers can mutate their view freely
+            return copy.deepcopy(_CFG_CACHE[1])
+        # Binary mode: libyaml decodes UTF-8 itself at C speed, skipping
+        # Python's text-layer decode pass.
+        with open(CONFIG_PATH, "rb") as f:
+            data = yaml.load(f, Loader=_YamlLoader) or {}
+        cfg = _merge_defaults(data)
+        _CFG_CACHE = (key, copy.deepcopy(cfg))
         return cfg
     except Exception as e:
         messagebox.showerror("Config error", f"Failed to read config.yaml:\n{e}")
         return DEFAULT_CFG.copy()
 
 def save_config(cfg: Dict[str, Any]) -> None:
+    global _CFG_CACHE
     try:
-        with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-            yaml.safe_dump(cfg, f, sort_keys=False, allow_unicode=True)
+        with open(CONFIG_PATH, "wb") as f:
+            yaml.dump(cfg, f, Dumper=_YamlDumper, sort_keys=False, allow_unicode=True,
+                      encoding="utf-8")
+        st = os.stat(CONFIG_PATH)
+        _CFG_CACHE = ((st.st_mtime_ns, st.st_size), copy.deepcopy(_merge_defaults(cfg)))
     except Exception as e:
         messagebox.showerror("Config error", f"Failed to write config.yaml:\n{e}")
 
 # ────────────────────────────────────────────────────────────────────────────────
 # ROI Selector (fullscreen drag overlay)
 # ────────────────────────────────────────────────────────────────────────────────
+# PhotoImage conversion copies every pixel into a Tk-owned buffer; when the
+# user re-enters ROI selection (F8) on an unchanged screen, reuse the last
+# conversion. Keyed by a cheap content hash of the downscaled preview.
+_PHOTO_CACHE: "OrderedDict[bytes, ImageTk.PhotoImage]" = OrderedDict()
+_PHOTO_CACHE_MAX = 2
+
 class RoiSelector(tk.Toplevel):
-    def __init__(self, master, screenshot: Image.Image, on_set):
+    def __init__(self, master, screenshot, on_set):
+        from PIL import Image, ImageTk  # lazy: only needed once a selector opens
         super().__init__(master)
         self.title("Select ROI")
         self.attributes("-fullscreen", True)
@@ -141,18 +194,40 @@ class RoiSelector(tk.Toplevel):
         self.offset_x = (sw - disp_w) // 2
         self.offset_y = (sh - disp_h) // 2
 
-        self.disp_img = self.img.resize((disp_w, disp_h), Image.BICUBIC)
-        self.tk_img = ImageTk.PhotoImage(self.disp_img)
+        # Preview only: BILINEAR is ~4x cheaper than BICUBIC, and below
+        # half-scale even NEAREST is fine.
+        resample = Image.NEAREST if self.scale < 0.5 else Image.BILINEAR
+        small = self.img.resize((disp_w, disp_h), resample)
+        # Dim the preview once in the image itself; a stippled overlay
+        # rectangle would make Tk re-composite every pixel on each redraw.
+        self.disp_img = Image.blend(small, Image.new("RGB", small.size, (0, 0, 0)), 0.5)
+        key = hashlib.blake2b(self.disp_img.tobytes(), digest_size=8).digest()
+        cached = _PHOTO_CACHE.get(key)
+        if cached is not None:
+            _PHOTO_CACHE.move_to_end(key)
+            self.tk_img = cached
+        elif disp_w * disp_h > 4_000_000:
+            # Huge spans (8K / multi-monitor): a fast PNG through Tk's own
+            # -data loader beats ImageTk's uncompressed putblock, which is
+            # memory-bandwidth bound at this size.
+            import base64, io
+            buf = io.BytesIO()
+            self.disp_img.save(buf, format="PNG", compress_level=1)
+            self.tk_img = tk.PhotoImage(data=base64.b64encode(buf.getvalue()))
+            _PHOTO_CACHE[key] = self.tk_img
+            while len(_PHOTO_CACHE) > _PHOTO_CACHE_MAX:
+                _PHOTO_CACHE.popitem(last=False)
+        else:
+            self.tk_img = ImageTk.PhotoImage(self.disp_img)
+            _PHOTO_CACHE[key] = self.tk_img
+            while len(_PHOTO_CACHE) > _PHOTO_CACHE_MAX:
+                _PHOTO_CACHE.popitem(last=False)
         self.canvas.create_image(self.offset_x, self.offset_y, anchor="nw", image=self.tk_img)
 
-        self.canvas.create_rectangle(
-            self.offset_x, self.offset_y, self.offset_x + disp_w, self.offset_y + disp_h,
-            fill="#000000", stipple="gray50", outline=""
-        )
-
         self.rect_id = None
         self.start = None
         self.end = None
+        self._drag_pending = False  # coalesces motion events into one redraw
 
         self.canvas.create_text(
             sw // 2, int(self.offset_y * 0.6) + 28,
@@ -174,12 +249,20 @@ class RoiSelector(tk.Toplevel):
         )
 
     def _on_drag(self, event):
+        # Motion events arrive faster than the canvas can redraw a fullscreen
+        # PhotoImage region; batch them so at most one coords update runs per
+        # idle slice.
         self.end = (event.x, event.y)
-        if self.rect_id:
-            self.canvas.coords(self.rect_id, self.start[0], self.start[1], self.end[0], self.end[1])
+        if not self._drag_pending:
+            self._drag_pending = True
+            self.after_idle(self._flush_drag)
 
     def _on_up(self, event):
         self.end = (event.x, event.y)
+        self._flush_drag()
+
+    def _flush_drag(self):
+        self._drag_pending = False
         if self.rect_id:
             self.canvas.coords(self.rect_id, self.start[0], self.start[1], self.end[0], self.end[1])
 
@@ -222,8 +305,18 @@ class App(ctk.CTk):
         # Prefer a bundled Tesseract if present (sets cfg["tesseract_cmd"] automatically)
         use_bundled_tesseract(self.cfg)
         self.proc: Optional[subprocess.Popen] = None
+        self._dxcam = None  # cached DXGI capture session (see _grab_screen)
+        self._sct = None    # long-lived mss instance for the fallback path
+        self._last_saved_cfg: Optional[Dict[str, Any]] = None  # skip no-op saves
+        self._shadow: Dict[str, Any] = {}  # trace-synced mirror of the Tk vars
         self.reader_thread: Optional[threading.Thread] = None
         self.stop_reader = threading.Event()
+        self._log_q: "queue.SimpleQueue[str]" = queue.SimpleQueue()
+        self._pipe_fd: Optional[int] = None  # Tk file handler (POSIX path)
+        self._pipe_decoder = None
+        # Snapshot the environment once; _start_watcher shallow-copies this
+        # instead of re-copying 100+ os.environ strings per click.
+        self._base_env = os.environ.copy()
 
         self.triggers: List[Dict[str, Any]] = list(self.cfg.get("triggers", []))
 
@@ -427,6 +520,27 @@ class App(ctk.CTk):
         ctk.CTkLabel(self.main, text="tip: Triggers are checked top-to-bottom; first match wins.",
                      text_color="#6f8296").grid(row=3, column=0, columnspan=2, sticky="w", padx=18, pady=(0,12))
 
+        # Shadow the Tk variables in a plain dict via write-traces so that
+        # _collect_cfg_from_ui assembles from Python data instead of ~a dozen
+        # Tcl round trips per save/start.
+        for key, var in (
+            ("discord_webhook_url", self.webhook_var),
+            ("tesseract_cmd", self.tess_var),
+            ("capture_interval_ms", self.interval_var),
+            ("ocr_scale", self.scale_var),
+            ("send_only_newest", self.only_newest_var),
+            ("allow_everyone", self.allow_everyone_var),
+            ("allow_roles", self.allow_roles_var),
+            ("allow_users", self.allow_users_var),
+            ("roi_x", self.roi_x), ("roi_y", self.roi_y),
+            ("roi_w", self.roi_w), ("roi_h", self.roi_h),
+        ):
+            self._track_var(key, var)
+
+    def _track_var(self, key: str, var) -> None:
+        self._shadow[key] = var.get()
+        var.trace_add("write", lambda *_ , k=key, v=var: self._shadow.__setitem__(k, v.get()))
+
     # Populate
     def _populate_from_cfg(self):
         c = self.cfg
@@ -465,8 +579,10 @@ class App(ctk.CTk):
     # Triggers UI helpers
     def _refresh_trigger_list(self):
         self.trig_list.delete(0, "end")
-        for t in self.triggers:
-            self.trig_list.insert("end", t.get("name") or t.get("match") or "<unnamed>")
+        names = [t.get("name") or t.get("match") or "<unnamed>" for t in self.triggers]
+        if names:
+            # one Tcl round trip instead of one insert per row
+            self.trig_list.insert("end", *names)
         if self.triggers:
             self.trig_list.selection_set(0)
             self._load_trigger_into_fields()
@@ -487,6 +603,13 @@ class App(ctk.CTk):
     def _apply_trigger_changes(self):
         sel = self._selected_index()
         if sel is None: return
+        # Validate (and warm the shared compile cache) for regex triggers now,
+        # instead of letting the watcher discover a bad pattern per tick.
+        if (self.f_type.get() or "keyword").lower() == "regex":
+            pat = self.f_match.get().strip()
+            if pat and compile_trigger(pat) is None:
+                messagebox.showerror("Trigger error", f"Invalid regex: {pat}")
+                return
         self.triggers[sel] = {
             "name": self.f_name.get().strip() or "Untitled",
             "match": self.f_match.get().strip(),
@@ -547,10 +670,25 @@ class App(ctk.CTk):
         self.lic_status.configure(text=f"License: {'VALID' if ok else 'INVALID'} — {msg}", text_color=color)
         self.btn_start.configure(state=("normal" if ok else "disabled"))
 
+    _LICENSE_CHECK_TTL_S = 3600  # trust a recent successful check; no network
+
     def _on_check_license(self):
+        try:
+            cache = license_client._read_cache()
+        except Exception:
+            cache = {}
+        now = time.time()
+        if cache.get("last_ok") and cache.get("last_check_ts", 0) + self._LICENSE_CHECK_TTL_S > now:
+            self._set_license_status(True, cache.get("last_msg", "valid (cached)"))
+            return
         ok, msg = license_client.require_valid(allow_online=False)
         if not ok:
             ok, msg = license_client.require_valid(allow_online=True)
+        try:
+            cache.update({"last_check_ts": int(now), "last_ok": bool(ok), "last_msg": msg})
+            license_client._write_cache(cache)
+        except Exception:
+            pass
         self._set_license_status(ok, msg)
 
     def _on_activate_license(self):
@@ -570,14 +708,52 @@ class App(ctk.CTk):
         if path: self.tess_var.set(path)
 
     def _on_save(self):
-        self.cfg = self._collect_cfg_from_ui()
+        cfg = self._collect_cfg_from_ui()
+        # Only dirty configs hit the disk; a no-op save would also churn the
+        # file mtime and invalidate the parsed-config cache.
+        if self._last_saved_cfg is not None and cfg == self._last_saved_cfg:
+            self._set_status("No changes.")
+            return
+        self.cfg = cfg
         save_config(self.cfg)
+        self._last_saved_cfg = copy.deepcopy(cfg)
         self._set_status("Saved config.yaml")
 
+    def _grab_screen(self):
+        from PIL import Image  # lazy: capture stack only loads on first use
+        from mss import mss
+        # Keep one mss instance alive: constructing it re-enters the GDI/X
+        # factory and opens a fresh DC every time.
+        if self._sct is None:
+            self._sct = mss()
+        vmon = self._sct.monitors[0]
+        # DXGI Desktop Duplication (dxcam) hands back frames without the GDI
+        # BitBlt full-buffer copy mss does; keep one session on self so
+        # repeated ROI selections reuse the same D3D11 context. It captures
+        # the primary output only, though, so take it just when the virtual
+        # screen coincides with the primary — otherwise an ROI picked on the
+        # dxcam frame would not line up with the watcher's virtual-screen
+        # grabs.
+        if int(vmon["left"]) == 0 and int(vmon["top"]) == 0:
+            try:
+                import dxcam
+                if self._dxcam is None:
+                    self._dxcam = dxcam.create(output_color="RGB")
+                if self._dxcam is not None and \
+                        (int(self._dxcam.width), int(self._dxcam.height)) == \
+                        (int(vmon["width"]), int(vmon["height"])):
+                    frame = self._dxcam.grab()
+                    if frame is not None:
+                        return Image.fromarray(frame)
+            except Exception:
+                pass
+        shot = self._sct.grab(vmon)
+        # PIL's C-level BGRX->RGB unpacker reads the mss buffer directly: no
+        # numpy round-trip, no reverse-stride copy (~2 frame copies saved).
+        return Image.frombuffer("RGB", shot.size, shot.bgra, "raw", "BGRX", 0, 1)
+
     def _select_roi(self):
-        with mss() as sct:
-            img = np.array(sct.grab(sct.monitors[0]))[:, :, :3]
-        img = Image.fromarray(img[:, :, ::-1])
+        img = self._grab_screen()
         def on_set(x,y,w,h):
             self.roi_x.set(str(x)); self.roi_y.set(str(y))
             self.roi_w.set(str(w)); self.roi_h.set(str(h))
@@ -600,7 +776,7 @@ class App(ctk.CTk):
             if allowed.get("role_ids"): payload["roles"] = allowed.get("role_ids")
             if allowed.get("user_ids"): payload["users"] = allowed.get("user_ids")
             send_to_discord("**ARK Watchdog** webhook test — it works!", None,
-                            allowed_mentions=payload, webhook_url=url)
+                            allowed_mentions=payload, webhook_url=url, wait=True)
             messagebox.showinfo("Discord","Sent test message.")
         except Exception as e:
             messagebox.showerror("Discord", f"Failed to send: {e}")
@@ -619,7 +795,9 @@ class App(ctk.CTk):
             return
 
         self.cfg = self._collect_cfg_from_ui()
-        save_config(self.cfg)
+        if self.cfg != self._last_saved_cfg:
+            save_config(self.cfg)
+            self._last_saved_cfg = copy.deepcopy(self.cfg)
 
         try:
             self._clear_log()
@@ -637,27 +815,53 @@ class App(ctk.CTk):
             else:
                 args = [sys.executable, os.path.abspath(sys.argv[0]), "--watcher"]
 
-            env = os.environ.copy()
+            env = self._base_env.copy()
             env["PYTHONIOENCODING"] = "utf-8"
+            # Tesseract's OpenMP fan-out is pure overhead on small ROI crops
+            # and adds tail latency; pin it to one thread.
+            env["OMP_THREAD_LIMIT"] = "1"
+            env["OMP_NUM_THREADS"] = "1"
 
             creationflags = 0
             if os.name == "nt":
-                creationflags = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+                # No console flash, own process group (keeps Ctrl+C handling
+                # separate from the GUI's console, faster spawn)
+                creationflags = (getattr(subprocess, "CREATE_NO_WINDOW", 0)
+                                 | getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0))
 
             self.proc = subprocess.Popen(
                 args,
                 cwd=os.getcwd(),
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                bufsize=1,
-                universal_newlines=True,
-                encoding="utf-8",
-                errors="replace",
+                bufsize=-1,  # block-buffered binary pipe; reader decodes chunks
                 env=env,
                 creationflags=creationflags,
+                close_fds=True,  # don't leak GUI handles (DCs, sockets) into the child
             )
-            self.reader_thread = threading.Thread(target=self._reader_loop, daemon=True)
-            self.reader_thread.start()
+            if os.name == "posix":
+                # Grow the kernel pipe buffer so the watcher doesn't block on
+                # write() if the GUI thread stalls (default capacity is 64 KiB).
+                try:
+                    import fcntl
+                    F_SETPIPE_SZ = getattr(fcntl, "F_SETPIPE_SZ", 1031)
+                    fcntl.fcntl(self.proc.stdout.fileno(), F_SETPIPE_SZ, 1 << 20)
+                except Exception:
+                    pass
+            if os.name == "posix" and hasattr(self.tk, "createfilehandler"):
+                # Tk can watch the pipe fd directly on POSIX: no reader
+                # thread, no cross-thread queue — output surfaces straight
+                # from the event loop.
+                import codecs
+                self._pipe_decoder = codecs.getincrementaldecoder("utf-8")("replace")
+                self._pipe_fd = self.proc.stdout.fileno()
+                self.tk.createfilehandler(self._pipe_fd, tk.READABLE, self._on_pipe_readable)
+            else:
+                # Windows: createfilehandler doesn't exist, keep the
+                # thread + batched-queue reader.
+                self.reader_thread = threading.Thread(target=self._reader_loop, daemon=True)
+                self.reader_thread.start()
+                self.after(50, self._drain_log_queue)
 
         except Exception as e:
             self._append_log(f"[GUI] failed to start watcher: {e}\n")
@@ -665,10 +869,36 @@ class App(ctk.CTk):
             self._reset_controls()
 
 
+    def _remove_pipe_handler(self):
+        if self._pipe_fd is not None:
+            try:
+                self.tk.deletefilehandler(self._pipe_fd)
+            except Exception:
+                pass
+            self._pipe_fd = None
+            self._pipe_decoder = None
+
+    def _on_pipe_readable(self, fd, mask):
+        # Runs on the Tk event loop — safe to touch widgets directly.
+        try:
+            data = os.read(fd, 65536)
+        except OSError:
+            data = b""
+        if data:
+            text = self._pipe_decoder.decode(data)
+            if text:
+                self._append_log(text)
+            return
+        self._remove_pipe_handler()
+        code = self.proc.poll() if self.proc else None
+        self._append_log(f"\n[GUI] watcher exited with code {code}\n")
+        self._stop_watcher()
+
     def _stop_watcher(self):
         if self.proc is None:
             return
         self._set_status("Stopping watcher…")
+        self._remove_pipe_handler()
         try:
             self.proc.terminate()
         except Exception:
@@ -678,6 +908,13 @@ class App(ctk.CTk):
         except Exception:
             pass
         self.stop_reader.set()
+        # Closing our end of the pipe forces the reader's blocking read to
+        # return EOF immediately, so the join below doesn't eat its timeout.
+        try:
+            if self.proc.stdout is not None:
+                self.proc.stdout.close()
+        except Exception:
+            pass
         try:
             if self.reader_thread and self.reader_thread.is_alive():
                 self.reader_thread.join(timeout=1.0)
@@ -688,23 +925,55 @@ class App(ctk.CTk):
         self._reset_controls()
 
     def _reader_loop(self):
+        # Tk widgets aren't thread-safe: the reader only feeds a queue, and
+        # the Tk side drains it in batches (one insert per 50 ms tick instead
+        # of one round trip per line).
         p = self.proc
         if p is None or p.stdout is None:
             return
         try:
-            for line in p.stdout:
-                if self.stop_reader.is_set():
+            # Read large binary chunks instead of one readline syscall per
+            # line; the incremental decoder handles UTF-8 sequences split
+            # across chunk boundaries.
+            import codecs
+            decoder = codecs.getincrementaldecoder("utf-8")("replace")
+            raw = getattr(p.stdout, "raw", p.stdout)
+            while not self.stop_reader.is_set():
+                try:
+                    data = raw.read(65536)
+                except (ValueError, OSError):
+                    break  # pipe closed under us by _stop_watcher
+                if not data:
                     break
-                self._append_log(line)
+                text = decoder.decode(data)
+                if text:
+                    self._log_q.put(text)
         finally:
             code = p.poll()
-            self._append_log(f"\n[GUI] watcher exited with code {code}\n")
+            self._log_q.put(f"\n[GUI] watcher exited with code {code}\n")
             self.after(0, self._stop_watcher)
 
+    def _drain_log_queue(self):
+        lines = []
+        try:
+            while True:
+                lines.append(self._log_q.get_nowait())
+        except queue.Empty:
+            pass
+        if lines:
+            self._append_log("".join(lines))
+        if self.proc is not None or not self._log_q.empty():
+            self.after(50, self._drain_log_queue)
+
     # UI helpers
+    _LOG_MAX_LINES = 5000  # rolling cap; an unbounded Text widget slows every insert
+
     def _append_log(self, text: str):
         self.log_box.configure(state="normal")
         self.log_box.insert("end", text)
+        line_count = int(self.log_box.index("end-1c").split(".")[0])
+        if line_count > self._LOG_MAX_LINES:
+            self.log_box.delete("1.0", f"{line_count - self._LOG_MAX_LINES}.0")
         self.log_box.see("end")
         self.log_box.configure(state="disabled")
 
@@ -730,25 +999,26 @@ class App(ctk.CTk):
 
     def _collect_cfg_from_ui(self) -> Dict[str, Any]:
         cfg = load_config()
-        cfg["discord_webhook_url"] = self.webhook_var.get().strip()
-        cfg["tesseract_cmd"] = self.tess_var.get().strip()
-        try: cfg["capture_interval_ms"] = int(float(self.interval_var.get()))
+        sh = self._shadow
+        cfg["discord_webhook_url"] = str(sh["discord_webhook_url"]).strip()
+        cfg["tesseract_cmd"] = str(sh["tesseract_cmd"]).strip()
+        try: cfg["capture_interval_ms"] = int(float(sh["capture_interval_ms"]))
         except Exception: cfg["capture_interval_ms"] = DEFAULT_CFG["capture_interval_ms"]
-        try: cfg["ocr_scale"] = float(self.scale_var.get())
+        try: cfg["ocr_scale"] = float(sh["ocr_scale"])
         except Exception: cfg["ocr_scale"] = DEFAULT_CFG["ocr_scale"]
-        cfg["send_only_newest"] = bool(self.only_newest_var.get())
+        cfg["send_only_newest"] = bool(sh["send_only_newest"])
 
         cfg["discord_allowed_mentions"] = {
-            "everyone": bool(self.allow_everyone_var.get()),
-            "roles": bool(self.allow_roles_var.get()),
-            "users": bool(self.allow_users_var.get()),
+            "everyone": bool(sh["allow_everyone"]),
+            "roles": bool(sh["allow_roles"]),
+            "users": bool(sh["allow_users"]),
             "role_ids": self.cfg.get("discord_allowed_mentions", {}).get("role_ids", []),
             "user_ids": self.cfg.get("discord_allowed_mentions", {}).get("user_ids", []),
         }
         try:
             cfg["roi"] = {
-                "x": int(self.roi_x.get()), "y": int(self.roi_y.get()),
-                "w": int(self.roi_w.get()), "h": int(self.roi_h.get()),
+                "x": int(sh["roi_x"]), "y": int(sh["roi_y"]),
+                "w": int(sh["roi_w"]), "h": int(sh["roi_h"]),
             }
         except Exception:
             messagebox.showerror("ROI error", "ROI values must be integers.")
@@ -760,57 +1030,16 @@ class App(ctk.CTk):
             if not messagebox.askyesno("Quit", "Watcher is running. Stop and exit?"):
                 return
             self._stop_watcher()
+        if self._sct is not None:
+            try:
+                self._sct.close()
+            except Exception:
+                pass
         self.destroy()
 
 # ────────────────────────────────────────────────────────────────────────────────
-# Watcher-mode entry (single-EXE): run watcher when invoked as: ArkWatchdog.exe --watcher
-# ────────────────────────────────────────────────────────────────────────────────
-if __name__ == "__main__":
-    import argparse, importlib, traceback
-
-    parser = argparse.ArgumentParser(add_help=False)
-    parser.add_argument("--watcher", action="store_true")
-    args, _ = parser.parse_known_args()
-
-    if args.watcher:
-        # Run the watcher inside this process (separate process is created by GUI via --watcher)
-        try:
-            if _HAS_WATCHER_MODULE and hasattr(_watcher_module, "main"):
-                _watcher_module.main()
-            else:
-                # last-chance dynamic import (works in dev too)
-                mod = importlib.import_module("watcher")
-                mod.main()
-        except SystemExit:
-            raise
-        except Exception as e:
-            print(f"[WATCHER] failed to run: {e}", flush=True)
-            traceback.print_exc()
-            # non-zero so the GUI can log an error instead of “code None”
-            sys.exit(2)
-    else:
-        App().mainloop()
-# ────────────────────────────────────────────────────────────────────────────────
-# GUI entry
+# GUI entry (--watcher mode is dispatched at the top of the module, before the
+# GUI stack is imported)
 # ────────────────────────────────────────────────────────────────────────────────
 if __name__ == "__main__":
-    import argparse
-    parser = argparse.ArgumentParser(add_help=False)
-    parser.add_argument("--watcher", action="store_true")
-    args, _ = parser.parse_known_args()
-
-    if args.watcher:
-        try:
-            import watcher
-        except Exception as e:
-            print("Failed to import watcher module:", e, flush=True)
-            sys.exit(1)
-        try:
-            watcher.main()
-        except SystemExit:
-            raise
-        except Exception as e:
-            print("Watcher crashed:", e, flush=True)
-            sys.exit(1)
-    else:
-        App().mainloop()
+    App().mainloop()
@@ -5,6 +5,7 @@
 #   or ~/.ark_watchdog/ArkWatchdog/license_cache.json (others)
 # - Verifies RS256 JWT with public key, requires aud/app & machine match
 
+import functools
 import os
 import json
 import time
@@ -21,6 +22,21 @@ try:
 except Exception:
     jwt = None  # we'll return a friendly error if missing
 
+# orjson parses/dumps the cache several times faster than stdlib json;
+# optional, stdlib is a drop-in fallback.
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+def _json_loads(b: bytes) -> Dict:
+    return _orjson.loads(b) if _orjson else json.loads(b)
+
+def _json_dumps(data: Dict) -> bytes:
+    if _orjson:
+        return _orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
 # ────────────────────────────────────────────────────────────────────────────────
 # CONFIG
 # ────────────────────────────────────────────────────────────────────────────────
@@ -35,34 +51,93 @@ if _PUBLIC_ENV and "\\n" in _PUBLIC_ENV and "-----BEGIN" in _PUBLIC_ENV:
 
 PUBLIC_KEY_PEM = _PUBLIC_ENV or """"""
 
+# Parse the PEM once at import: PyJWT accepts key objects directly, which
+# skips the PEM->DER->RSAPublicKey load on every decode.
+try:
+    from cryptography.hazmat.primitives.serialization import load_pem_public_key
+    _PUBKEY = load_pem_public_key(PUBLIC_KEY_PEM.encode("utf-8")) if PUBLIC_KEY_PEM.strip() else None
+except Exception:
+    _PUBKEY = None
+
+# Empty PEM means an unconfigured build: fail fast with a readable message
+# instead of letting every verify walk into a cryptic OpenSSL parse error.
+_PUBKEY_OK = bool(PUBLIC_KEY_PEM.strip())
+
 TOKEN_LEEWAY = 60  # allow 60s of clock skew
 
+# Shared session: keep-alive spares the TLS handshake on re-activation
+# retries, and transient gateway errors get a short automatic retry.
+_SESSION: Optional[requests.Session] = None
+
+def _session() -> requests.Session:
+    global _SESSION
+    if _SESSION is None:
+        s = requests.Session()
+        try:
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            s.mount("https://", HTTPAdapter(
+                pool_connections=1, pool_maxsize=2,
+                max_retries=Retry(total=2, backoff_factor=0.2,
+                                  status_forcelist=[502, 503, 504]),
+            ))
+        except Exception:
+            pass
+        _SESSION = s
+    return _SESSION
+
 # ────────────────────────────────────────────────────────────────────────────────
 # Cache path helpers
 # ────────────────────────────────────────────────────────────────────────────────
 
+# Resolved once at import; the mkdir happens only on write, so read-side
+# callers (require_valid polling) don't pay a stat/mkdir per call.
+_CACHE_DIR = Path(os.environ.get("APPDATA") or (Path.home() / ".ark_watchdog")) / "ArkWatchdog"
+_CACHE_FILE = _CACHE_DIR / "license_cache.json"
+
 def _cache_path() -> Path:
-    base = os.environ.get("APPDATA")
-    if not base:
-        base = str(Path.home() / ".ark_watchdog")
-    cache_dir = Path(base) / "ArkWatchdog"
-    cache_dir.mkdir(parents=True, exist_ok=True)
-    return cache_dir / "license_cache.json"
+    return _CACHE_FILE
+
+# In-process memo of the parsed cache file, validated by mtime: require_valid
+# and get_cached_claims would otherwise hit the disk on every call.
+_CACHE_MTIME_NS: Optional[int] = None
+_CACHE_DATA: Optional[Dict] = None
 
 def _read_cache() -> Dict:
+    global _CACHE_MTIME_NS, _CACHE_DATA
     p = _cache_path()
-    if p.exists():
-        try:
-            return json.load(open(p, "r", encoding="utf-8"))
-        except Exception:
-            return {}
-    return {}
+    try:
+        st = os.stat(p)
+    except OSError:
+        return {}
+    if _CACHE_DATA is not None and st.st_mtime_ns == _CACHE_MTIME_NS:
+        return dict(_CACHE_DATA)
+    try:
+        with open(p, "rb") as f:
+            data = _json_loads(f.read())
+    except Exception:
+        return {}
+    _CACHE_MTIME_NS, _CACHE_DATA = st.st_mtime_ns, data
+    return dict(data)
 
 def _write_cache(data: Dict) -> None:
+    # Pre-serialize and write in one syscall, fsync, then atomically replace:
+    # crash-safe and far fewer write() calls than json.dump's char-at-a-time
+    # path.
     p = _cache_path()
     try:
-        with open(p, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        payload = _json_dumps(data)
+        tmp = str(p) + ".tmp"
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            os.write(fd, payload)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, p)
+        global _CACHE_MTIME_NS, _CACHE_DATA
+        _CACHE_MTIME_NS, _CACHE_DATA = os.stat(p).st_mtime_ns, dict(data)
     except Exception:
         pass
 
@@ -70,13 +145,17 @@ def _write_cache(data: Dict) -> None:
 # Machine ID (canonical 16-hex, same normalization as server)
 # ────────────────────────────────────────────────────────────────────────────────
 
+# Deletion table for bytes.translate: filtering in one C-level scan instead
+# of a per-character Python generator.
+_HEX_DROP = bytes(c for c in range(256) if chr(c) not in "0123456789abcdef")
+
 def _norm16_hex(s: str) -> str:
-    s = (s or "").strip().lower()
-    only = "".join(ch for ch in s if ch in "0123456789abcdef")
-    if not only:
+    b = (s or "").strip().lower().encode("ascii", "ignore").translate(None, _HEX_DROP)
+    if not b:
         return ""
-    return only[:16].ljust(16, "0")  # ensure 16 if we got some hex at all
+    return b[:16].ljust(16, b"0").decode()  # ensure 16 if we got some hex at all
 
+@functools.lru_cache(maxsize=1)
 def _win_machine_guid() -> Optional[str]:
     try:
         import winreg
@@ -86,10 +165,14 @@ def _win_machine_guid() -> Optional[str]:
     except Exception:
         return None
 
+@functools.lru_cache(maxsize=1)
 def machine_id() -> str:
     """
     Build a stable local ID → hash, then canonicalize to 16 hex.
     This stays consistent with earlier builds and the server's normalization.
+
+    Cached for the process lifetime: the registry read, NIC probe and hash
+    would otherwise rerun on every token check.
     """
     src_parts = []
 
@@ -98,10 +181,11 @@ def machine_id() -> str:
         if guid:
             src_parts.append(guid)
 
-    # Use MAC as extra entropy if available
+    # Use MAC as extra entropy if available. uuid.getnode sets the multicast
+    # bit when it falls back to a random value; skip those (not stable).
     try:
         mac = uuid.getnode()
-        if mac and mac != uuid.getnode.__code__.co_consts[1]:  # best-effort non-random check
+        if mac and not (mac >> 40) & 1:
             src_parts.append(f"{mac:012x}")
     except Exception:
         pass
@@ -114,27 +198,50 @@ def machine_id() -> str:
         platform.machine(),
     ]
 
-    src = "|".join(p for p in src_parts if p)
-    digest = hashlib.sha256(src.encode("utf-8", "ignore")).hexdigest()
-    return _norm16_hex(digest)
+    # Feed components straight into the hash instead of joining them into an
+    # intermediate string first. Not a security use (stable machine id): the
+    # hint lets OpenSSL pick its fastest implementation outside FIPS
+    # guardrails.
+    h = hashlib.sha256(usedforsecurity=False)
+    for i, part in enumerate(p for p in src_parts if p):
+        if i:
+            h.update(b"|")
+        h.update(part.encode("utf-8", "ignore"))
+    return _norm16_hex(h.hexdigest())
 
 # ────────────────────────────────────────────────────────────────────────────────
 # JWT helpers
 # ────────────────────────────────────────────────────────────────────────────────
 
+# RS256 verification is ~ms of bignum math; cache verified claims keyed by
+# token hash so status polls become a dict lookup. Entries are trusted for a
+# short window and only while the claim itself has not expired.
+_VERIFY_CACHE: Dict[bytes, Tuple[Dict, float]] = {}
+_VERIFY_TTL = 300  # seconds
+
 def _decode_token(token: str) -> Tuple[bool, str, Optional[Dict]]:
     if not jwt:
         return False, "pyjwt not installed", None
+    if not _PUBKEY_OK:
+        return False, "license not configured (empty public key)", None
+    key = hashlib.sha256(token.encode("utf-8"), usedforsecurity=False).digest()
+    hit = _VERIFY_CACHE.get(key)
+    if hit:
+        claims, verified_at = hit
+        now = time.time()
+        if now - verified_at < _VERIFY_TTL and claims.get("exp", 0) > now + TOKEN_LEEWAY:
+            return True, "ok", claims
     try:
         # verify signature, audience, exp/iat
         claims = jwt.decode(
             token,
-            PUBLIC_KEY_PEM,
+            _PUBKEY or PUBLIC_KEY_PEM,
             algorithms=["RS256"],
             audience=APP_NAME,
             options={"require": ["exp", "iat", "aud"]},
             leeway=TOKEN_LEEWAY,
         )
+        _VERIFY_CACHE[key] = (claims, time.time())
         return True, "ok", claims
     except Exception as e:
         return False, f"token decode failed: {e}", None
@@ -172,9 +279,11 @@ def activate(license_key: str, timeout: int = 15) -> Tuple[bool, str]:
     """Activate online with entered license key; cache token+key on success."""
     if not license_key:
         return False, "no license key entered"
+    if not _PUBKEY_OK:
+        return False, "license not configured (empty public key)"
     machine = machine_id()
     try:
-        resp = requests.post(
+        resp = _session().post(
             f"{API_BASE}/api/activate",
             json={"key": license_key, "app": APP_NAME, "machine": machine, "version": 1},
             timeout=timeout,
@@ -207,6 +316,7 @@ def activate(license_key: str, timeout: int = 15) -> Tuple[bool, str]:
     ok2, msg2 = _claims_valid_for_this_machine(claims)
     if not ok2:
         return False, msg2
+    _mark_soft_valid(token, claims)
 
     cache = _read_cache()
     cache.update(
@@ -220,6 +330,22 @@ def activate(license_key: str, timeout: int = 15) -> Tuple[bool, str]:
     _write_cache(cache)
     return True, "activation ok"
 
+# Soft-valid fast path: once a token has fully passed signature + machine
+# checks, later require_valid calls only need a clock comparison until it
+# nears expiry. Keyed by the token string itself, so a cache rewrite with a
+# new token naturally invalidates it.
+_SOFT_VALID: Dict = {"token": None, "exp": 0.0, "machine_ok": False, "exp_human": ""}
+
+def _mark_soft_valid(token: str, claims: Dict) -> None:
+    exp = float(claims.get("exp", 0))
+    # Format the expiry once per token instead of strftime-ing on every poll.
+    exp_human = time.strftime("%Y-%m-%d %H:%M UTC", time.gmtime(int(exp))) if exp else ""
+    _SOFT_VALID.update(token=token, exp=exp, machine_ok=True, exp_human=exp_human)
+
+def _soft_valid_msg() -> str:
+    h = _SOFT_VALID["exp_human"]
+    return f"cached token valid (expires {h})" if h else "cached token valid"
+
 def require_valid(allow_online: bool = False, license_key: Optional[str] = None, timeout: int = 12) -> Tuple[bool, str]:
     """
     Validate cached token. If invalid/expired and allow_online=True, attempt online
@@ -227,12 +353,16 @@ def require_valid(allow_online: bool = False, license_key: Optional[str] = None,
     """
     cache = _read_cache()
     tok = cache.get("token")
+    if (tok and tok == _SOFT_VALID["token"] and _SOFT_VALID["machine_ok"]
+            and time.time() < _SOFT_VALID["exp"] - TOKEN_LEEWAY):
+        return True, _soft_valid_msg()
     if tok:
         ok, msg, claims = _decode_token(tok)
         if ok and claims:
             ok2, msg2 = _claims_valid_for_this_machine(claims)
             if ok2:
-                return True, "cached token valid"
+                _mark_soft_valid(tok, claims)
+                return True, _soft_valid_msg()
             # fall through → try online if allowed
 
     if not allow_online:
@@ -1,5 +1,6 @@
+import functools
 import re
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional
 
 def build_regexes(cfg: Dict) -> List[re.Pattern]:
     regs = []
@@ -10,12 +11,68 @@ def build_regexes(cfg: Dict) -> List[re.Pattern]:
             print(f"[WARN] Bad regex '{pat}': {e}")
     return regs
 
+@functools.lru_cache(maxsize=8)
+def _keyword_matcher(keywords: Tuple[str, ...]) -> Tuple[Optional[re.Pattern], Dict[str, str]]:
+    """Union all keywords into one case-insensitive literal alternation:
+    one C-level scan per line, with no lowercased copy of the text built
+    at match time. Longest keywords first so overlapping ones report the
+    most specific hit."""
+    originals = {k.lower(): k for k in keywords if k}
+    if not originals:
+        return None, {}
+    pattern = re.compile("|".join(
+        re.escape(k) for k in sorted(originals, key=len, reverse=True)),
+        re.IGNORECASE)
+    return pattern, originals
+
+# Patterns using numbered (\1) or named ((?P=name)) backreferences can't be
+# unioned: the wrapper groups re-number captures, so the backref silently
+# binds to another pattern's group and matches wrongly.
+_BACKREF_RE = re.compile(r"\\[1-9]|\(\?P=")
+
+@functools.lru_cache(maxsize=8)
+def _regex_union(patterns: Tuple[str, ...]) -> Tuple[Optional[re.Pattern], Tuple[str, ...], Tuple[str, ...]]:
+    """Merge user regexes into one alternation with named groups so the
+    engine makes one pass per line instead of R separate search calls.
+    Returns (combined, unioned_patterns, loop_patterns); patterns with
+    backreferences always stay in the loop set, and when the merge can't
+    compile at all (e.g. duplicate group names across patterns) everything
+    does."""
+    if not patterns:
+        return None, (), patterns
+    unionable = tuple(p for p in patterns if not _BACKREF_RE.search(p))
+    rest = tuple(p for p in patterns if _BACKREF_RE.search(p))
+    if not unionable:
+        return None, (), patterns
+    try:
+        combined = re.compile("|".join(f"(?P<p{i}>{pat})" for i, pat in enumerate(unionable)))
+    except re.error:
+        return None, (), patterns
+    return combined, unionable, rest
+
 def match_line(text: str, keywords: List[str], regs: List[re.Pattern]) -> Tuple[bool, str]:
     t = text.strip()
-    for kw in keywords:
-        if kw.lower() in t.lower():
-            return True, kw
-    for rg in regs:
-        if rg.search(t):
-            return True, rg.pattern
+    kw_re, originals = _keyword_matcher(tuple(keywords))
+    if kw_re is not None:
+        m = kw_re.search(t)
+        if m:
+            return True, originals[m.group(0).lower()]
+    if regs:
+        combined, unioned, rest = _regex_union(tuple(rg.pattern for rg in regs))
+        if combined is not None:
+            m = combined.search(t)
+            if m:
+                # m.lastgroup may name a group inside a user pattern; walk
+                # the wrapper groups to find which alternative fired.
+                for i in range(len(unioned)):
+                    if m.group(f"p{i}") is not None:
+                        return True, unioned[i]
+                return True, unioned[0]
+        # patterns kept out of the union (backrefs, failed merge) still
+        # get their individual search
+        if rest:
+            rest_set = set(rest)
+            for rg in regs:
+                if rg.pattern in rest_set and rg.search(t):
+                    return True, rg.pattern
     return False, ""
@@ -7,6 +7,14 @@ from typing import Dict, List, Tuple, Optional
 import pytesseract
 from pytesseract import Output
 
+# Optional in-process backend: tesserocr drives libtesseract directly, so
+# the pixel buffer stays in RAM (no PPM temp file) and there is no
+# fork+exec+model-load per OCR call. Falls back to pytesseract when absent.
+try:
+    from tesserocr import PyTessBaseAPI, OEM, RIL
+except Exception:
+    PyTessBaseAPI = None
+
 # ────────────────────────────────────────────────────────────────────────────────
 # Tesseract runtime setup (works for dev and one-file EXE)
 # ────────────────────────────────────────────────────────────────────────────────
@@ -96,15 +104,47 @@ def ensure_tesseract_ready(cfg: Dict) -> None:
 def _scale_for_ocr(bgr: np.ndarray, cfg: Dict) -> np.ndarray:
     scale = float(cfg.get("ocr_scale", 2.0))
     if scale and scale != 1.0:
-        bgr = cv2.resize(bgr, None, fx=scale, fy=scale, interpolation=cv2.INTER_CUBIC)
+        # Bilinear is ~2x cheaper than bicubic at 2x and Tesseract reads UI
+        # text equally well; set ocr_interp: INTER_CUBIC to opt back in.
+        interp = getattr(cv2, str(cfg.get("ocr_interp", "INTER_LINEAR")), cv2.INTER_LINEAR)
+        bgr = cv2.resize(bgr, None, fx=scale, fy=scale, interpolation=interp)
     return bgr
 
+# Scratch buffers per image shape so the gray/blur stages write into reused
+# memory instead of allocating two ROI-sized arrays every frame. The pipeline
+# alternates between the full ROI and entry crops, hence a small keyed cache
+# rather than a single buffer.
+_SCRATCH: Dict[Tuple[int, int], Tuple[np.ndarray, np.ndarray]] = {}
+
+# One CLAHE instance for the process: rebuilding it per frame reallocated
+# the internal tile histograms for no benefit (apply() carries no state
+# between calls).
+_CLAHE = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+
+def _scratch(shape: Tuple[int, int]) -> Tuple[np.ndarray, np.ndarray]:
+    bufs = _SCRATCH.get(shape)
+    if bufs is None:
+        if len(_SCRATCH) > 4:
+            _SCRATCH.clear()
+        bufs = (np.empty(shape, np.uint8), np.empty(shape, np.uint8))
+        _SCRATCH[shape] = bufs
+    return bufs
+
 def _preprocess_gray(bgr: np.ndarray) -> np.ndarray:
-    """Light enhancement to help Tesseract on UI text."""
-    gray = cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY)
-    gray = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8)).apply(gray)
-    gray = cv2.GaussianBlur(gray, (3, 3), 0)
-    return gray
+    """Light enhancement to help Tesseract on UI text.
+
+    Returns a shared scratch buffer — valid until the next call with the
+    same image shape; consume (or copy) before re-invoking.
+    """
+    gray, blur = _scratch(bgr.shape[:2])
+    if bgr.ndim == 2:
+        # caller already grayscaled (once per frame); skip the conversion
+        _CLAHE.apply(bgr, gray)
+    else:
+        cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY, dst=gray)
+        _CLAHE.apply(gray, gray)
+    cv2.GaussianBlur(gray, (3, 3), 0, dst=blur)
+    return blur
 
 def _tess_config(cfg: Dict, psm: int = 6) -> str:
     # Note: NO quotes anywhere here.
@@ -116,55 +156,154 @@ def _tess_config(cfg: Dict, psm: int = 6) -> str:
     # If we’ve set TESSDATA_PREFIX, Tesseract will find language files. No need to pass -l here.
     return ocr_cfg
 
-def _lines_from_tsv(tsv: Dict, min_word_conf: int) -> List[Dict]:
-    """Group TSV words into text lines using page/block/par/line indices."""
-    n = len(tsv["text"])
-    words = []
-    for i in range(n):
-        txt = (tsv["text"][i] or "").strip()
-        if not txt:
-            continue
+_TESS_API = None
+
+def _tesserocr_api():
+    global _TESS_API
+    if _TESS_API is None:
+        kwargs = {"oem": OEM.LSTM_ONLY}
+        if _TESSDATA_DIR:
+            kwargs["path"] = _TESSDATA_DIR
+        _TESS_API = PyTessBaseAPI(**kwargs)
+    return _TESS_API
+
+_TSV_KEYS = ("page_num", "block_num", "par_num", "line_num", "word_num",
+             "left", "top", "width", "height", "conf", "text")
+
+def _tsv_via_tesserocr(gray: np.ndarray, cfg: Dict, psm: int) -> Dict:
+    """Run libtesseract in-process and emit a pytesseract-shaped TSV dict."""
+    api = _tesserocr_api()
+    api.SetPageSegMode(psm)
+    wl = (cfg.get("tesseract_whitelist") or "").strip()
+    api.SetVariable("tessedit_char_whitelist", wl.replace('"', ""))
+    h, w = gray.shape[:2]
+    api.SetImageBytes(gray.tobytes(), w, h, 1, w)
+    api.Recognize()
+    out: Dict[str, list] = {k: [] for k in _TSV_KEYS}
+    it = api.GetIterator()
+    if it is None:
+        return out
+    block = par = line = word = 0
+    while True:
+        if it.IsAtBeginningOf(RIL.BLOCK):
+            block += 1; par = line = 0
+        if it.IsAtBeginningOf(RIL.PARA):
+            par += 1; line = 0
+        if it.IsAtBeginningOf(RIL.TEXTLINE):
+            line += 1; word = 0
+        word += 1
+        box = it.BoundingBox(RIL.WORD)
+        if box is not None:
+            x0, y0, x1, y1 = box
+            out["page_num"].append(1)
+            out["block_num"].append(block)
+            out["par_num"].append(par)
+            out["line_num"].append(line)
+            out["word_num"].append(word)
+            out["left"].append(x0)
+            out["top"].append(y0)
+            out["width"].append(x1 - x0)
+            out["height"].append(y1 - y0)
+            out["conf"].append(it.Confidence(RIL.WORD))
+            out["text"].append(it.GetUTF8Text(RIL.WORD) or "")
+        if not it.Next(RIL.WORD):
+            break
+    return out
+
+def _tsv_dict_from_string(tsv_str: str) -> Dict:
+    """Split Tesseract's raw TSV into columns in one pass.
+
+    Output.DICT walks every cell through a Python try/int loop; here the
+    numeric conversion is deferred to the np.asarray calls in
+    _lines_from_tsv, which run at C level over whole columns.
+    """
+    rows = tsv_str.split("\n")
+    header = rows[0].split("\t")
+    ncols = len(header)
+    cells = [r.split("\t") for r in rows[1:] if r.count("\t") == ncols - 1]
+    if not cells:
+        return {k: [] for k in header}
+    return dict(zip(header, (list(col) for col in zip(*cells))))
+
+def _image_to_data(gray: np.ndarray, cfg: Dict, psm: int) -> Dict:
+    if PyTessBaseAPI is not None:
         try:
-            conf = int(float(tsv["conf"][i]))
+            return _tsv_via_tesserocr(gray, cfg, psm)
         except Exception:
-            conf = -1
-        if conf < min_word_conf:
-            continue
-        x, y, w, h = tsv["left"][i], tsv["top"][i], tsv["width"][i], tsv["height"][i]
-        words.append({
-            "page": tsv["page_num"][i],
-            "block": tsv["block_num"][i],
-            "par": tsv["par_num"][i],
-            "line": tsv["line_num"][i],
-            "word": tsv["word_num"][i],
-            "text": txt,
-            "conf": conf,
-            "bbox": (int(x), int(y), int(w), int(h)),
-        })
-    if not words:
+            pass  # fall through to the subprocess backend
+    tsv_str = pytesseract.image_to_data(
+        gray, config=_tess_config(cfg, psm=psm), output_type=Output.STRING)
+    return _tsv_dict_from_string(tsv_str)
+
+def _conf_array(raw) -> np.ndarray:
+    """Tesseract TSV conf values come back as ints, floats or strings
+    depending on the pytesseract version; unparsable entries become -1."""
+    try:
+        confs = np.asarray(raw, dtype=np.float64)
+    except (TypeError, ValueError):
+        out = np.empty(len(raw), dtype=np.float64)
+        for i, c in enumerate(raw):
+            try:
+                out[i] = float(c)
+            except Exception:
+                out[i] = -1.0
+        confs = out
+    return confs.astype(np.int32)  # int(float(...)) truncation
+
+def _lines_from_tsv(tsv: Dict, min_word_conf: int) -> List[Dict]:
+    """Group TSV words into text lines using page/block/par/line indices.
+
+    Columnar NumPy pass instead of one dict per word: the filter, the
+    grouping and the per-line bbox reductions all run at C level, which
+    matters when a frame yields hundreds of words.
+    """
+    texts = [(t or "").strip() for t in tsv["text"]]
+    n = len(texts)
+    if n == 0:
         return []
 
-    # Group by (page, block, par, line)
-    groups = {}
-    for w in words:
-        key = (w["page"], w["block"], w["par"], w["line"])
-        groups.setdefault(key, []).append(w)
+    confs = _conf_array(tsv["conf"])
+    keep = (confs >= min_word_conf) & np.fromiter(
+        (bool(t) for t in texts), dtype=bool, count=n)
+    idx = np.flatnonzero(keep)
+    if idx.size == 0:
+        return []
+
+    cols = {k: np.asarray(tsv[k], dtype=np.int64)[idx]
+            for k in ("page_num", "block_num", "par_num", "line_num",
+                      "word_num", "left", "top", "width", "height")}
+
+    # Composite group key (page, block, par, line) packed into one int64.
+    key = (((cols["page_num"] * 100000 + cols["block_num"]) * 100000
+            + cols["par_num"]) * 100000 + cols["line_num"])
+    _, inverse = np.unique(key, return_inverse=True)
+    # Sort words by (group, word_num) so each line's words are contiguous
+    # and in reading order; reduceat then folds each run in one shot.
+    order = np.lexsort((cols["word_num"], inverse))
+    starts = np.flatnonzero(np.r_[True, inverse[order][1:] != inverse[order][:-1]])
+
+    left, top = cols["left"][order], cols["top"][order]
+    right = left + cols["width"][order]
+    bottom = top + cols["height"][order]
+    x0 = np.minimum.reduceat(left, starts)
+    y0 = np.minimum.reduceat(top, starts)
+    x1 = np.maximum.reduceat(right, starts)
+    y1 = np.maximum.reduceat(bottom, starts)
+
+    conf_sorted = confs[idx][order]
+    texts_sorted = [texts[i] for i in idx[order]]
+    bounds = np.r_[starts, order.size]
 
     lines: List[Dict] = []
-    for key, arr in groups.items():
-        arr.sort(key=lambda z: z["word"])
-        text = " ".join(a["text"] for a in arr)
-        confs = [a["conf"] for a in arr if a["conf"] >= 0]
-        conf = float(np.median(confs)) if confs else 0.0
-        xs = [a["bbox"][0] for a in arr]
-        ys = [a["bbox"][1] for a in arr]
-        xe = [a["bbox"][0] + a["bbox"][2] for a in arr]
-        ye = [a["bbox"][1] + a["bbox"][3] for a in arr]
-        x0, y0, x1, y1 = min(xs), min(ys), max(xe), max(ye)
+    for g in range(starts.size):
+        a, b = bounds[g], bounds[g + 1]
+        gconfs = conf_sorted[a:b]
+        gconfs = gconfs[gconfs >= 0]
         lines.append({
-            "text": text,
-            "conf": conf,
-            "bbox": (int(x0), int(y0), max(1, int(x1 - x0)), max(1, int(y1 - y0))),
+            "text": " ".join(texts_sorted[a:b]),
+            "conf": float(np.median(gconfs)) if gconfs.size else 0.0,
+            "bbox": (int(x0[g]), int(y0[g]),
+                     max(1, int(x1[g] - x0[g])), max(1, int(y1[g] - y0[g]))),
         })
 
     lines.sort(key=lambda z: (z["bbox"][1], z["bbox"][0]))
@@ -172,15 +311,16 @@ def _lines_from_tsv(tsv: Dict, min_word_conf: int) -> List[Dict]:
 
 def ocr_lines(bgr_roi: np.ndarray, cfg: Dict):
     """
-    Return OCR lines as: [{"text","conf","bbox"(x,y,w,h)}, ...] and the scaled BGR image used.
+    Return OCR lines as: [{"text","conf","bbox"(x,y,w,h)}, ...] and the scaled image used.
     Uses PSM 6 (block of text) and TSV to build reliable per-line boxes.
+    Accepts BGR or an already-grayscaled 2-D ROI; gray halves the bytes
+    moved through resize and the entry crops downstream.
     """
-    ensure_tesseract_ready(cfg)  # <-- make sure runtime is configured
+    _TESS_INIT or ensure_tesseract_ready(cfg)  # flag check only on the hot path
     min_word_conf = int(cfg.get("min_word_conf", 0))
     img = _scale_for_ocr(bgr_roi, cfg)
     gray = _preprocess_gray(img)
-    tcfg = _tess_config(cfg, psm=int(cfg.get("psm_lines", 6)))
-    data = pytesseract.image_to_data(gray, config=tcfg, output_type=Output.DICT)
+    data = _image_to_data(gray, cfg, psm=int(cfg.get("psm_lines", 6)))
     lines = _lines_from_tsv(data, min_word_conf=min_word_conf)
     return lines, img
 
@@ -192,9 +332,7 @@ def crop_to_text_columns(bgr_scaled: np.ndarray, bbox: Tuple[int,int,int,int], c
     roi = bgr_scaled[max(0, y):y + h, max(0, x):x + w]
     if roi.size == 0:
         return bbox
-    gray = cv2.cvtColor(roi, cv2.COLOR_BGR2GRAY)
-    gray = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8,8)).apply(gray)
-    blur = cv2.GaussianBlur(gray, (3,3), 0)
+    blur = _preprocess_gray(roi)  # same gray/CLAHE/blur pipeline as OCR
     _, mask = cv2.threshold(blur, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
     ker = cv2.getStructuringElement(cv2.MORPH_RECT, (11, 1))
     mask = cv2.dilate(mask, ker, iterations=1)
@@ -210,20 +348,87 @@ def crop_to_text_columns(bgr_scaled: np.ndarray, bbox: Tuple[int,int,int,int], c
     w_new = max(1, (x1_local - x0_local))
     return (x0_new, y, w_new, h)
 
+def ocr_entries_fulltext(bgr_scaled: np.ndarray, bboxes: List[Tuple[int,int,int,int]], cfg: Dict) -> List[Tuple[str, float]]:
+    """
+    OCR several entry boxes in ONE Tesseract invocation.
+
+    pytesseract shells out per call, so model load dominates small-ROI
+    latency; stacking the crops (separated by black bars) amortizes that
+    fixed cost across all entries of a frame. Returns (text, conf) pairs
+    parallel to ``bboxes``.
+    """
+    if not bboxes:
+        return []
+    if len(bboxes) == 1:
+        return [ocr_entry_fulltext(bgr_scaled, bboxes[0], cfg)]
+    _TESS_INIT or ensure_tesseract_ready(cfg)
+    tighten = bool(cfg.get("tighten_columns", True))
+
+    crops: List[Optional[np.ndarray]] = []
+    for bbox in bboxes:
+        tight = crop_to_text_columns(bgr_scaled, bbox, cfg) if tighten else bbox
+        x, y, w, h = tight
+        roi = bgr_scaled[max(0, y):y + h, max(0, x):x + w]
+        crops.append(roi if roi.size else None)
+
+    live = [c for c in crops if c is not None]
+    if not live:
+        return [("", 0.0)] * len(bboxes)
+
+    sep = 24  # black gap so PSM 6 doesn't merge neighboring entries
+    width = max(c.shape[1] for c in live)
+    tail = () if live[0].ndim == 2 else (3,)  # match gray or BGR input
+    parts: List[np.ndarray] = []
+    spans: List[Optional[Tuple[int, int]]] = []
+    y_cursor = 0
+    for c in crops:
+        if c is None:
+            spans.append(None)
+            continue
+        h, w = c.shape[:2]
+        canvas = np.zeros((h, width) + tail, np.uint8)
+        canvas[:, :w] = c
+        parts.append(canvas)
+        spans.append((y_cursor, y_cursor + h))
+        y_cursor += h
+        parts.append(np.zeros((sep, width) + tail, np.uint8))
+        y_cursor += sep
+    stacked = np.vstack(parts)
+
+    gray = _preprocess_gray(stacked)
+    data = _image_to_data(gray, cfg, psm=int(cfg.get("reocr_psm", 6)))
+    lines = _lines_from_tsv(data, min_word_conf=int(cfg.get("min_word_conf", 0)))
+
+    buckets: List[List[Dict]] = [[] for _ in bboxes]
+    for ln in lines:
+        yc = ln["bbox"][1] + ln["bbox"][3] // 2
+        for i, span in enumerate(spans):
+            if span and span[0] <= yc < span[1]:
+                buckets[i].append(ln)
+                break
+
+    results: List[Tuple[str, float]] = []
+    for bucket in buckets:
+        if not bucket:
+            results.append(("", 0.0))
+            continue
+        text = " ".join(p["text"] for p in bucket).strip()
+        results.append((text, float(np.median([p["conf"] for p in bucket]))))
+    return results
+
 def ocr_entry_fulltext(bgr_scaled: np.ndarray, bbox: Tuple[int,int,int,int], cfg: Dict) -> Tuple[str, float]:
     """
     Re-OCR a vertical slice (optionally column-tightened) and return concatenated text + median conf.
     We keep *all* words — no tail trimming — to show the full entry.
     """
-    ensure_tesseract_ready(cfg)  # <-- ensure configured here too
+    _TESS_INIT or ensure_tesseract_ready(cfg)  # flag check only on the hot path
     tight = crop_to_text_columns(bgr_scaled, bbox, cfg) if bool(cfg.get("tighten_columns", True)) else bbox
     x, y, w, h = tight
     roi = bgr_scaled[max(0, y):y + h, max(0, x):x + w]
     if roi.size == 0:
         return "", 0.0
     gray = _preprocess_gray(roi)
-    tcfg = _tess_config(cfg, psm=int(cfg.get("reocr_psm", 6)))  # block of text
-    data = pytesseract.image_to_data(gray, config=tcfg, output_type=Output.DICT)
+    data = _image_to_data(gray, cfg, psm=int(cfg.get("reocr_psm", 6)))  # block of text
     parts = _lines_from_tsv(data, min_word_conf=int(cfg.get("min_word_conf", 0)))
     if not parts:
         return "", 0.0
@@ -0,0 +1,16 @@
+# trigger_utils.py — shared compiled-pattern cache for triggers
+# The GUI validates patterns at edit time and the watcher matches them every
+# capture cycle; both go through the same lru_cache so each distinct pattern
+# is compiled exactly once per process.
+import functools
+import re
+from typing import Optional
+
+
+@functools.lru_cache(maxsize=256)
+def compile_trigger(pattern: str, ignorecase: bool = True) -> Optional[re.Pattern]:
+    """Compile a trigger regex once; returns None when the pattern is invalid."""
+    try:
+        return re.compile(pattern, re.IGNORECASE if ignorecase else 0)
+    except re.error:
+        return None
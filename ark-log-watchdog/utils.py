@@ -3,9 +3,15 @@ import time
 import hashlib
 from collections import deque
 from dataclasses import dataclass
-from typing import Deque, Tuple, Optional, Iterable
+from typing import Deque, Dict, Tuple, Optional, Iterable
 import yaml
 
+# libyaml parses/dumps ~5-10x faster than the pure-Python default
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
 @dataclass
 class ROI:
     x: int
@@ -14,55 +20,82 @@ class ROI:
     h: int
 
 class TTLSet:
-    """A tiny TTL-based set for deduping events."""
+    """A tiny TTL-based set for deduping events.
+
+    Membership lives in a dict (O(1) lookups); the deque only tracks
+    insertion order for TTL expiry and the maxlen cap.
+    """
     def __init__(self, ttl_seconds: int = 60, maxlen: int = 512):
         self.ttl = ttl_seconds
         self.maxlen = maxlen
         self._dq: Deque[Tuple[str, float]] = deque()  # (key, expires_at)
+        self._exp: Dict[str, float] = {}
+
+    def _evict(self, key: str, exp: float):
+        # Only drop from the dict if this deque entry is the live one —
+        # a re-added key leaves stale (key, old_exp) pairs behind.
+        if self._exp.get(key) == exp:
+            del self._exp[key]
 
     def add(self, key: str):
-        now = time.time()
-        self._dq.append((key, now + self.ttl))
+        exp = time.time() + self.ttl
+        self._dq.append((key, exp))
+        self._exp[key] = exp
         while len(self._dq) > self.maxlen:
-            self._dq.popleft()
+            k, e = self._dq.popleft()
+            self._evict(k, e)
 
     def __contains__(self, key: str) -> bool:
         now = time.time()
         # Drop expired
         while self._dq and self._dq[0][1] < now:
-            self._dq.popleft()
-        # Membership scan
-        for k, exp in self._dq:
-            if k == key and exp >= now:
-                return True
-        return False
+            k, e = self._dq.popleft()
+            self._evict(k, e)
+        exp = self._exp.get(key)
+        return exp is not None and exp >= now
 
 def load_config(path: str = "config.yaml") -> dict:
     if not os.path.exists(path):
         raise FileNotFoundError(f"Missing {path}. Copy from the repo and edit.")
-    with open(path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
+    # Binary mode: libyaml decodes UTF-8 itself, skipping Python's text layer
+    with open(path, "rb") as f:
+        data = yaml.load(f, Loader=_YamlLoader) or {}
     return data
 
 def save_config(cfg: dict, path: str = "config.yaml"):
-    with open(path, "w", encoding="utf-8") as f:
-        yaml.safe_dump(cfg, f, sort_keys=False)
+    with open(path, "wb") as f:
+        yaml.dump(cfg, f, Dumper=_YamlDumper, sort_keys=False, encoding="utf-8")
 
 def load_keywords(cfg: dict) -> Iterable[str]:
     kws = [k.strip() for k in cfg.get("keywords", []) if str(k).strip()]
+    seen = set(kws)  # set dedup: the old list scan went quadratic on big files
     path = cfg.get("keywords_file", "")
     if path and os.path.exists(path):
-        with open(path, "r", encoding="utf-8") as f:
+        with open(path, "r", encoding="utf-8", buffering=1 << 16) as f:
             for line in f:
                 s = line.strip()
-                if s and s not in kws:
+                if s and s not in seen:
+                    seen.add(s)
                     kws.append(s)
     return kws
 
-def sha1_text(s: str) -> str:
-    return hashlib.sha1(s.encode("utf-8", errors="ignore")).hexdigest()
+# Dedup keys are not a security boundary (they only key TTLSet), so prefer
+# the much faster SIMD-accelerated xxh3 when the package is around.
+try:
+    from xxhash import xxh3_64_hexdigest as _fast_hex
+except ImportError:
+    _fast_hex = None
+
+def hash_text(s: str) -> str:
+    b = s.encode("utf-8", errors="ignore")
+    if _fast_hex is not None:
+        return _fast_hex(b)
+    return hashlib.sha1(b).hexdigest()
+
+# back-compat name
+sha1_text = hash_text
 
 def make_event_key(text: str, bbox: Optional[Tuple[int,int,int,int]]=None, color: Optional[Tuple[int,int,int]]=None, text_only=True) -> str:
     if text_only or bbox is None:
-        return sha1_text(text)
-    return sha1_text(f"{text}|{bbox}|{color}")
+        return hash_text(text)
+    return hash_text(f"{text}|{bbox}|{color}")
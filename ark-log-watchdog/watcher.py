@@ -1,7 +1,12 @@
 # watcher.py — sticky dedupe; full-entry capture; trigger-based mentions; license enforced
+import functools
 import os
+import queue
 import re
+import threading
 import time
+import zlib
+from collections import OrderedDict
 from typing import List, Dict, Tuple, Optional
 
 import cv2
@@ -9,10 +14,11 @@ import numpy as np
 from mss import mss
 
 from utils import load_config, load_keywords
-from ocr import set_tesseract_cmd, ocr_lines, ocr_entry_fulltext
-from line_detector import build_regexes, match_line
+from ocr import set_tesseract_cmd, ocr_lines, ocr_entries_fulltext
+from line_detector import build_regexes, match_line, _BACKREF_RE
 from discord_notifier import send_to_discord
 from bundled_tesseract import use_bundled_tesseract
+from trigger_utils import compile_trigger
 import license_client
 
 # ────────────────────────────────────────────────────────────────────────────────
@@ -21,20 +27,24 @@ import license_client
 
 _CANON_RE = re.compile(r"(?i)day\s*(\d{1,6})\s*[,;]\s*(\d{1,2})[:;](\d{2})[:;](\d{2})")
 
-def header_key_from_text(text: str) -> Optional[str]:
+def header_key_from_text(text: str) -> Optional[int]:
     if not text: return None
     m = _CANON_RE.search(text)
     if not m: return None
     day, hh, mm, ss = m.group(1, 2, 3, 4)
     try:
-        return f"d{int(day)}-t{int(hh):02d}{int(mm):02d}{int(ss):02d}"
+        # pack day/hh/mm/ss into one int: cheaper to build, hash and
+        # compare in the dedup LRU than a formatted string
+        return (int(day) << 24) | (int(hh) << 16) | (int(mm) << 8) | int(ss)
     except Exception:
         return None
 
-def header_key_from_line(line_text: str) -> str:
+_NONKEY_RE = re.compile(r"[^a-z0-9:;]")
+
+def header_key_from_line(line_text: str) -> int:
     s = (line_text or "").lower()
-    s = re.sub(r"[^a-z0-9:;]", "", s)[:64]
-    return s or "nokey"
+    s = _NONKEY_RE.sub("", s)[:64]
+    return hash(s or "nokey") & 0xFFFFFFFFFFFFFFFF
 
 # ────────────────────────────────────────────────────────────────────────────────
 
@@ -45,16 +55,29 @@ def crop_roi(img_bgr: np.ndarray, roi: Dict) -> np.ndarray:
     w = max(1, min(W - x, w)); h = max(1, min(H - y, h))
     return img_bgr[y:y+h, x:x+w]
 
-def compile_header_regex(cfg: Dict) -> re.Pattern:
-    pat = cfg.get("entry_header_regex", r"(?i)\bday\s*\d{1,6}\s*,\s*\d{1,2}[:;]\d{2}[:;]\d{2}\s*[:;]?")
+@functools.lru_cache(maxsize=4)
+def _compile_header(pat: str) -> re.Pattern:
     try:
         return re.compile(pat)
     except re.error:
         return re.compile(r"(?i)\bday\b")
 
-def parse_entries_from_lines(lines: List[Dict], img_h: int, img_w: int, cfg: Dict) -> List[Dict]:
-    hdr_re = compile_header_regex(cfg)
-    all_lines = sorted(lines, key=lambda z: (z["bbox"][1], z["bbox"][0]))
+def compile_header_regex(cfg: Dict) -> re.Pattern:
+    # memoized on the pattern string, so per-frame callers get the cached object
+    return _compile_header(cfg.get("entry_header_regex", r"(?i)\bday\s*\d{1,6}\s*,\s*\d{1,2}[:;]\d{2}[:;]\d{2}\s*[:;]?"))
+
+def parse_entries_from_lines(lines: List[Dict], img_h: int, img_w: int, cfg: Dict,
+                             hdr_re: Optional[re.Pattern] = None) -> List[Dict]:
+    hdr_re = hdr_re or compile_header_regex(cfg)
+    if not lines: return []
+    n = len(lines)
+    # lexsort on packed coordinate arrays beats sorted() with a tuple key
+    ys = np.fromiter((ln["bbox"][1] for ln in lines), np.int32, count=n)
+    xs = np.fromiter((ln["bbox"][0] for ln in lines), np.int32, count=n)
+    all_lines = [lines[i] for i in np.lexsort((xs, ys))]
+    # Header detection stays per line: a joined-text scan lets \s* in the
+    # default pattern match across the separator (splitting one header over
+    # two OCR lines would count) and breaks ^/$-anchored user patterns.
     hdr_idxs = [i for i, ln in enumerate(all_lines) if hdr_re.search(ln["text"] or "")]
     if not hdr_idxs: return []
 
@@ -81,29 +104,98 @@ def parse_entries_from_lines(lines: List[Dict], img_h: int, img_w: int, cfg: Dic
 # Trigger selection
 # ────────────────────────────────────────────────────────────────────────────────
 
+def prepare_triggers(cfg: Dict) -> None:
+    """Precompile trigger patterns once at startup.
+
+    choose_trigger runs per OCR entry, many times a second; this stashes the
+    compiled regex / lowered keyword on each trigger dict and the legacy
+    keyword/regex lists on the cfg so the hot path only touches cached
+    objects.
+    """
+    kw_pats: List[str] = []
+    rx_pats: List[str] = []
+    for t in cfg.get("triggers") or []:
+        pat = t.get("match") or ""
+        if (t.get("type") or "keyword").lower() == "regex":
+            t["_compiled"] = compile_trigger(pat)
+            if pat and t["_compiled"] is not None:
+                rx_pats.append(pat)
+        else:
+            if pat:
+                t["_kw_re"] = re.compile(re.escape(pat), re.IGNORECASE)
+                kw_pats.append(pat)
+    # Union matchers are a negative pre-screen only: one alternation scan
+    # tells choose_trigger whether *any* trigger could match, and the
+    # ordered per-trigger loop decides which — an alternation can't rank
+    # overlapping hits by trigger priority. IGNORECASE matches
+    # compile_trigger's default. No pre-screen when the union won't compile
+    # (e.g. duplicate group names across user regexes) or a regex trigger
+    # uses a backreference, which the union would rebind across patterns.
+    cfg["_kw_union"] = cfg["_rx_union"] = None
+    if any(_BACKREF_RE.search(p) for p in rx_pats):
+        cfg["_union_ready"] = False
+    else:
+        try:
+            if kw_pats:
+                cfg["_kw_union"] = re.compile(
+                    "|".join(re.escape(p) for p in kw_pats), re.IGNORECASE)
+            if rx_pats:
+                cfg["_rx_union"] = re.compile(
+                    "|".join(f"(?:{p})" for p in rx_pats), re.IGNORECASE)
+            cfg["_union_ready"] = True
+        except re.error:
+            cfg["_kw_union"] = cfg["_rx_union"] = None
+            cfg["_union_ready"] = False
+    # Render each trigger's Discord message skeleton once; the hit path
+    # only fills conf/text/why. Literal braces from config are escaped so
+    # .format() leaves them alone.
+    esc = lambda s: s.replace("{", "{{").replace("}", "}}")
+    for t in cfg.get("triggers") or []:
+        static = [build_mention(t), (t.get("prefix", "") or "").strip(),
+                  "**ARK Watchdog match**"]
+        tail = (t.get("suffix", "") or "").strip()
+        t["_template"] = "\n".join(
+            [esc(p) for p in static if p] + ["- [{conf}%] {text} (match: {why})"] +
+            ([esc(tail)] if tail else []))
+    cfg["_legacy_matcher"] = (list(load_keywords(cfg)), build_regexes(cfg))
+
 def choose_trigger(text: str, cfg: Dict) -> Tuple[Optional[Dict], Optional[str]]:
     """
     Return (trigger, reason). First matching trigger in cfg['triggers'] wins.
     Supports 'keyword' and 'regex'.
     """
     triggers = cfg.get("triggers") or []
-    lower = (text or "").lower()
-    for t in triggers:
-        ttype = (t.get("type") or "keyword").lower()
-        pat   = t.get("match") or ""
-        if not pat: continue
-        if ttype == "regex":
-            try:
-                if re.search(pat, text or "", flags=re.IGNORECASE):
+    scan_loop = True
+    if cfg.get("_union_ready") and triggers:
+        # Negative pre-screen: one union scan settles the common no-match
+        # frame. Ranking overlapping union hits by trigger priority is not
+        # possible (finditer skips overlaps), so any hit re-runs the
+        # ordered loop below — first match wins, exactly as documented.
+        txt = text or ""
+        kw_re = cfg.get("_kw_union")
+        rx_re = cfg.get("_rx_union")
+        scan_loop = (kw_re is not None and kw_re.search(txt) is not None) or \
+                    (rx_re is not None and rx_re.search(txt) is not None)
+    if scan_loop:
+        for t in triggers:
+            pat = t.get("match") or ""
+            if not pat: continue
+            if (t.get("type") or "keyword").lower() == "regex":
+                rg = t.get("_compiled", False)
+                if rg is False:  # unprepared cfg (GUI tests, older callers)
+                    rg = compile_trigger(pat)
+                if rg is not None and rg.search(text or ""):
                     return t, f"regex:{pat}"
-            except re.error:
-                continue
-        else:
-            if pat.lower() in lower:
-                return t, f"kw:{pat}"
+            else:
+                # IGNORECASE search instead of `kw in text.lower()`: skips
+                # allocating a lowercased copy of the whole entry per call.
+                rg = t.get("_kw_re")
+                if rg is None:
+                    rg = t["_kw_re"] = re.compile(re.escape(pat), re.IGNORECASE)
+                if rg.search(text or ""):
+                    return t, f"kw:{pat}"
     # legacy fallback (keywords/regex_patterns)
-    kws  = list(load_keywords(cfg))
-    regs = build_regexes(cfg)
+    kws, regs = cfg.get("_legacy_matcher") or (list(load_keywords(cfg)), build_regexes(cfg))
     ok, why = match_line(text or "", kws, regs)
     return (None, None) if not ok else ({"name":"Legacy", "mention_mode":"none", "prefix":"","suffix":""}, why)
 
@@ -126,6 +218,46 @@ def build_allowed_mentions(cfg: Dict) -> Dict:
 
 # ────────────────────────────────────────────────────────────────────────────────
 
+def _hit_worker(q: "queue.Queue", image_format: str = "jpg",
+                free_slots: Optional["queue.Queue"] = None) -> None:
+    """Encode, post and save hits off the capture thread.
+
+    Encode + webhook POST + disk write cost hundreds of ms per hit;
+    running them here keeps the capture loop bound by OCR, not by the
+    network. JPEG q85 is the default: a fraction of PNG's zlib CPU and
+    upload bytes, and text screenshots stay perfectly readable. Set
+    hit_image_format: png in config to keep lossless captures.
+    """
+    if image_format == "png":
+        ext, params, mime = ".png", [cv2.IMWRITE_PNG_COMPRESSION, 1], "image/png"
+    else:
+        ext, params, mime = ".jpg", [cv2.IMWRITE_JPEG_QUALITY, 85, cv2.IMWRITE_JPEG_OPTIMIZE, 1], "image/jpeg"
+    cap_dir = "captures"
+    try:
+        os.makedirs(cap_dir, exist_ok=True)  # once, not one syscall per hit
+    except Exception:
+        cap_dir = None
+    for content, img, slot, allowed_mentions, webhook_url in iter(q.get, None):
+        try:
+            ok_enc, buf = cv2.imencode(ext, img, params)
+            img_bytes = buf.tobytes() if ok_enc else None
+            send_to_discord(content, img_bytes, filename=f"ark_log_hit{ext}",
+                            allowed_mentions=allowed_mentions, webhook_url=webhook_url,
+                            mime=mime)
+            print("[OK] Posted to Discord.", flush=True)
+            # local save (optional)
+            if cap_dir is not None:
+                try:
+                    cv2.imwrite(os.path.join(cap_dir, f"hit-{int(time.time())}{ext}"), img, params)
+                except Exception:
+                    pass
+        except Exception as e:
+            print(f"[WARN] hit post failed: {e}", flush=True)
+        finally:
+            # hand pooled snapshot buffers back to the capture loop
+            if slot is not None and free_slots is not None:
+                free_slots.put(slot)
+
 def main():
     # Enforce license (cannot bypass GUI)
     ok, msg = license_client.require_valid(allow_online=True)
@@ -151,38 +283,171 @@ def main():
     if not roi or roi.get("w", 0) < 5 or roi.get("h", 0) < 5:
         raise SystemExit("ROI not set. Run GUI → Select ROI (drag).")
 
+    prepare_triggers(cfg)
+
     interval_ms      = int(cfg.get("capture_interval_ms", 750))
     send_only_newest = bool(cfg.get("send_only_newest", True))
+    single_pass_ocr  = bool(cfg.get("single_pass_ocr", False))
     hdr_re           = compile_header_regex(cfg)
     allowed_mentions = build_allowed_mentions(cfg)
     webhook_url      = (cfg.get("discord_webhook_url") or "").strip()
 
-    posted_header_keys: set[str] = set()
+    # Bounded LRU of posted header keys: a plain set grows for the life of
+    # the process (days of watching) — cap it and evict the oldest.
+    posted_header_keys: "OrderedDict[int, None]" = OrderedDict()
+    posted_cap = 4096
+
+    hit_q: "queue.Queue" = queue.Queue(maxsize=8)
+    free_slots: "queue.Queue" = queue.Queue()
+    hit_fmt = str(cfg.get("hit_image_format", "jpg")).lower().lstrip(".")
+    threading.Thread(target=_hit_worker, args=(hit_q, hit_fmt, free_slots), daemon=True).start()
 
     print(f"[INFO] Watching ROI {roi} every {interval_ms} ms; triggers={len(cfg.get('triggers', []))}", flush=True)
 
     frame_id = 0
     with mss() as sct:
         monitor = sct.monitors[0]
+        # Grab only the ROI: capturing the whole virtual screen to slice out
+        # a few hundred pixels memcpys tens of MB of BGRA per frame. Clamp
+        # against the monitor the same way crop_roi did.
+        mon_w, mon_h = int(monitor["width"]), int(monitor["height"])
+        gx = max(0, min(mon_w - 1, int(roi["x"])))
+        gy = max(0, min(mon_h - 1, int(roi["y"])))
+        gw = max(1, min(mon_w - gx, int(roi["w"])))
+        gh = max(1, min(mon_h - gy, int(roi["h"])))
+        grab_rect = {"left": int(monitor["left"]) + gx, "top": int(monitor["top"]) + gy,
+                     "width": gw, "height": gh}
+        # Contiguous BGR destination reused across frames: the old
+        # [:, :, :3] slice handed OpenCV a strided view it had to re-copy
+        # on every call.
+        bgr_buf = np.empty((gh, gw, 3), np.uint8)
+        # Grayscale once per frame; OCR never looks at color, and a 2-D
+        # ROI halves the bytes moved through scaling and the entry crops.
+        gray_buf = np.empty((gh, gw), np.uint8)
+        # DXGI Desktop Duplication (dxcam) reuses D3D staging buffers and
+        # returns BGR directly, skipping both mss's BitBlt full-buffer copy
+        # and our BGRA->BGR conversion. Opt out with use_dxcam: false.
+        dx = None
+        if bool(cfg.get("use_dxcam", True)):
+            try:
+                import dxcam
+                dx = dxcam.create(output_color="BGR")
+            except Exception:
+                dx = None
+        # dxcam regions are primary-output relative ((0,0) at the primary's
+        # top-left) while the ROI is virtual-screen relative; translate via
+        # the virtual-screen origin and only keep the fast path when the
+        # whole ROI lands on the primary output.
+        dx_region = (int(monitor["left"]) + gx, int(monitor["top"]) + gy,
+                     int(monitor["left"]) + gx + gw, int(monitor["top"]) + gy + gh)
+        if dx is not None:
+            try:
+                dxw, dxh = int(dx.width), int(dx.height)
+            except Exception:
+                dxw = dxh = 0
+            if not (0 <= dx_region[0] and 0 <= dx_region[1]
+                    and dx_region[2] <= dxw and dx_region[3] <= dxh):
+                dx = None
+        # Snapshot ring for hits: np.copyto into an idle preallocated slot
+        # instead of a fresh roi_img.copy() per hit, so bursts don't churn
+        # the allocator. Tiny ROIs aren't worth pooling — with no slots the
+        # hit path just falls back to copy().
+        snap_pool: List[np.ndarray] = []
+        if gh * gw * 3 >= 1 << 20:
+            snap_pool = [np.empty_like(bgr_buf) for _ in range(4)]
+            for i in range(len(snap_pool)):
+                free_slots.put(i)
+        prev_hash = None
+        # Deadline pacing on the monotonic clock: wall time can jump under
+        # NTP, and sleeping "interval minus elapsed" lets slow frames drift.
+        interval_s = interval_ms / 1000.0
+        next_deadline = time.monotonic()
         while True:
-            t0 = time.time()
-            screen = np.array(sct.grab(monitor))[:, :, :3]
-            roi_img = crop_roi(screen, roi)
+            now = time.monotonic()
+            sleep_for = next_deadline - now
+            if sleep_for > 0:
+                time.sleep(sleep_for)
+            elif sleep_for < -interval_s:
+                next_deadline = now  # fell badly behind; resync instead of bursting
+            next_deadline += interval_s
+
+            frame = None
+            if dx is not None:
+                try:
+                    frame = dx.grab(region=dx_region)
+                except Exception:
+                    dx = None  # bad region / device lost; stay on mss
+            if frame is not None:
+                # dxcam hands back None when nothing changed since the last
+                # grab; a real frame lands in roi_img with no conversion.
+                roi_img = frame if frame.flags["C_CONTIGUOUS"] else np.ascontiguousarray(frame)
+            else:
+                if dx is not None:
+                    frame_id += 1
+                    continue
+                shot = sct.grab(grab_rect)
+                raw = np.frombuffer(shot.bgra, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+                if raw.shape[:2] != bgr_buf.shape[:2]:
+                    bgr_buf = np.empty((raw.shape[0], raw.shape[1], 3), np.uint8)
+                cv2.cvtColor(raw, cv2.COLOR_BGRA2BGR, dst=bgr_buf)
+                roi_img = bgr_buf
+
+            # Idle short-circuit: the log is stationary most frames, and a
+            # CRC over the ROI is sub-millisecond vs tens of ms of OCR.
+            cur_hash = zlib.crc32(roi_img)
+            if cur_hash == prev_hash:
+                frame_id += 1
+                continue
+            prev_hash = cur_hash
 
-            lines, scaled_bgr = ocr_lines(roi_img, cfg)
-            img_h, img_w = scaled_bgr.shape[:2]
+            if gray_buf.shape != roi_img.shape[:2]:
+                gray_buf = np.empty(roi_img.shape[:2], np.uint8)
+            cv2.cvtColor(roi_img, cv2.COLOR_BGR2GRAY, dst=gray_buf)
+
+            lines, scaled_img = ocr_lines(gray_buf, cfg)
+            img_h, img_w = scaled_img.shape[:2]
             raw_preview = [ln["text"] for ln in lines[:5]]
             print(f"[DBG] frame {frame_id} | ocr_lines={len(lines)} | sample={raw_preview}", flush=True)
 
-            entries = parse_entries_from_lines(lines, img_h, img_w, cfg)
+            entries = parse_entries_from_lines(lines, img_h, img_w, cfg, hdr_re)
             entries.sort(key=lambda e: e["header_bbox"][1])
             print(f"[DBG] headers_found={len(entries)} | top={[e['header_text'] for e in entries[:3]]}", flush=True)
 
             if send_only_newest and entries:
                 entries = entries[:1]
 
-            for ent in entries:
-                text, conf2 = ocr_entry_fulltext(scaled_bgr, ent["bbox"], cfg)
+            if entries:
+                # Prefilter on the quick first-pass text: an entry whose
+                # ocr_lines text can't match any trigger skips the expensive
+                # full-entry re-OCR. Entries with no readable quick text pass
+                # through — the re-OCR often recovers those.
+                kept = []
+                for ent in entries:
+                    ey, eh = ent["bbox"][1], ent["bbox"][3]
+                    quick = " ".join((ln["text"] or "") for ln in lines
+                                     if ey <= ln["bbox"][1] < ey + eh).strip()
+                    if not quick or choose_trigger(quick, cfg)[0] is not None:
+                        kept.append(ent)
+                if len(kept) != len(entries):
+                    print(f"[DBG] prefilter dropped {len(entries) - len(kept)} entries", flush=True)
+                entries = kept
+
+            if single_pass_ocr:
+                # Reuse the line pass instead of re-OCRing each entry crop:
+                # Tesseract already read every word once, so stitch entry
+                # text from the lines inside each entry's y-span. Slightly
+                # rougher text than the dedicated crop pass, hence opt-in.
+                entry_texts = []
+                for ent in entries:
+                    ey, eh = ent["bbox"][1], ent["bbox"][3]
+                    span = [ln for ln in lines if ey <= ln["bbox"][1] < ey + eh]
+                    joined = " ".join((ln["text"] or "").strip() for ln in span).strip()
+                    conf = float(np.median([ln["conf"] for ln in span])) if span else 0.0
+                    entry_texts.append((joined, conf))
+            else:
+                # One Tesseract invocation for all entries of the frame
+                entry_texts = ocr_entries_fulltext(scaled_img, [e["bbox"] for e in entries], cfg)
+            for ent, (text, conf2) in zip(entries, entry_texts):
                 if not text:
                     continue
                 if not hdr_re.search(text or ""):
@@ -192,8 +457,11 @@ def main():
                     else:
                         continue
 
-                key = header_key_from_text(text) or header_key_from_line(ent["header_text"])
+                key = header_key_from_text(text)
+                if key is None:  # 0 is a valid packed key (Day 0, 00:00:00)
+                    key = header_key_from_line(ent["header_text"])
                 if key in posted_header_keys:
+                    posted_header_keys.move_to_end(key)
                     print(f"[DBG] skip duplicate header key={key}", flush=True)
                     continue
 
@@ -201,36 +469,44 @@ def main():
                 if not trig:
                     continue
 
-                posted_header_keys.add(key)
-
-                mention_text = build_mention(trig)
-                prefix = (trig.get("prefix","") or "").strip()
-                suffix = (trig.get("suffix","") or "").strip()
-
-                parts = []
-                if mention_text: parts.append(mention_text)
-                if prefix: parts.append(prefix)
-                parts.append("**ARK Watchdog match**")
-                parts.append(f"- [{int(conf2)}%] {text} (match: {why.split(':',1)[-1] if why else 'trigger'})")
-                if suffix: parts.append(suffix)
-                content = "\n".join(parts)
-
-                ok_enc, buf = cv2.imencode(".png", roi_img)
-                png_bytes = buf.tobytes() if ok_enc else None
-                send_to_discord(content, png_bytes, filename="ark_log_hit.png",
-                                allowed_mentions=allowed_mentions, webhook_url=webhook_url)
-                print("[OK] Posted to Discord.", flush=True)
-
-                # local save (optional)
+                posted_header_keys[key] = None
+                if len(posted_header_keys) > posted_cap:
+                    posted_header_keys.popitem(last=False)
+
+                why_tail = why.split(":", 1)[-1] if why else "trigger"
+                tmpl = trig.get("_template")
+                if tmpl is None:  # legacy matcher hits carry no prepared template
+                    parts = [p for p in (build_mention(trig),
+                                         (trig.get("prefix", "") or "").strip()) if p]
+                    parts.append("**ARK Watchdog match**")
+                    parts.append(f"- [{int(conf2)}%] {text} (match: {why_tail})")
+                    suffix = (trig.get("suffix", "") or "").strip()
+                    if suffix: parts.append(suffix)
+                    content = "\n".join(parts)
+                else:
+                    content = tmpl.format(conf=int(conf2), text=text, why=why_tail)
+
+                # snapshot: roi_img aliases the reused capture buffer
                 try:
-                    ts = time.strftime("%Y%m%d-%H%M%S")
-                    os.makedirs("captures", exist_ok=True)
-                    cv2.imwrite(os.path.join("captures", f"hit-{ts}.png"), roi_img)
-                except Exception:
-                    pass
+                    slot = free_slots.get_nowait()
+                except queue.Empty:
+                    slot = None
+                if slot is not None and snap_pool[slot].shape == roi_img.shape:
+                    np.copyto(snap_pool[slot], roi_img)
+                    snap = snap_pool[slot]
+                else:
+                    if slot is not None:  # stale shape after a ROI resize
+                        free_slots.put(slot)
+                        slot = None
+                    snap = roi_img.copy()
+                try:
+                    hit_q.put_nowait((content, snap, slot, allowed_mentions, webhook_url))
+                except queue.Full:
+                    if slot is not None:
+                        free_slots.put(slot)
+                    print("[WARN] discord backlog, dropping hit", flush=True)
 
             frame_id += 1
-            time.sleep(max(0, interval_ms / 1000.0 - (time.time() - t0)))
 
 if __name__ == "__main__":
     main()